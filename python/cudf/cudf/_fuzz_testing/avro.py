@@ -1,9 +1,7 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 
-import copy
 import io
 import logging
-import random
 
 import numpy as np
 
@@ -12,19 +10,34 @@ from cudf._fuzz_testing.io import IOFuzz
 from cudf._fuzz_testing.utils import (
     ALL_POSSIBLE_VALUES,
     _generate_rand_meta,
+    _generate_rand_seed,
     pandas_to_avro,
     pyarrow_to_pandas,
 )
 from cudf.testing import dataset_generator as dg
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
+logger = logging.getLogger(__name__)
+
+_AVRO_DTYPES_LIST = list(
+    cudf.utils.dtypes.ALL_TYPES
+    - {"category"}
+    # No unsigned support in avro:
+    # https://avro.apache.org/docs/current/spec.html
+    - cudf.utils.dtypes.UNSIGNED_TYPES
+    # TODO: Remove DATETIME_TYPES once
+    # following bug is fixed:
+    # https://github.com/rapidsai/cudf/issues/6482
+    - cudf.utils.dtypes.DATETIME_TYPES
+    # TODO: Remove DURATION_TYPES once
+    # following bug is fixed:
+    # https://github.com/rapidsai/cudf/issues/6604
+    - cudf.utils.dtypes.TIMEDELTA_TYPES
 )
 
 
 class AvroReader(IOFuzz):
+    __slots__ = ("_df",)
+
     def __init__(
         self,
         dirs=None,
@@ -53,44 +66,30 @@ class AvroReader(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            dtypes_list = list(
-                cudf.utils.dtypes.ALL_TYPES
-                - {"category"}
-                # No unsigned support in avro:
-                # https://avro.apache.org/docs/current/spec.html
-                - cudf.utils.dtypes.UNSIGNED_TYPES
-                # TODO: Remove DATETIME_TYPES once
-                # following bug is fixed:
-                # https://github.com/rapidsai/cudf/issues/6482
-                - cudf.utils.dtypes.DATETIME_TYPES
-                # TODO: Remove DURATION_TYPES once
-                # following bug is fixed:
-                # https://github.com/rapidsai/cudf/issues/6604
-                - cudf.utils.dtypes.TIMEDELTA_TYPES
-            )
-
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
-                self, dtypes_list
+                self, _AVRO_DTYPES_LIST
             )
             self._current_params["dtypes_meta"] = dtypes_meta
-            seed = random.randint(0, 2 ** 32 - 1)
+            seed = _generate_rand_seed()
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_cols"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
         self._df = df
-        logging.info(f"Shape of DataFrame generated: {table.shape}")
+        logger.info("Shape of DataFrame generated: %s", table.shape)
 
         file_obj = io.BytesIO()
         pandas_to_avro(df, file_io_obj=file_obj)
-        file_obj.seek(0)
-        buf = file_obj.read()
-        self._current_buffer = copy.copy(buf)
+        # ``bytes`` are immutable, so the same object can be kept around for
+        # crash dumps and handed to the reader without copying it.
+        buf = file_obj.getvalue()
+        self._current_buffer = buf
         return (df, buf)
 
     def write_data(self, file_name):
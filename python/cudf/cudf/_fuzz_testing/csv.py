@@ -10,16 +10,13 @@ from cudf._fuzz_testing.io import IOFuzz
 from cudf._fuzz_testing.utils import (
     ALL_POSSIBLE_VALUES,
     _generate_rand_meta,
+    _generate_rand_seed,
     pyarrow_to_pandas,
 )
 from cudf.testing import dataset_generator as dg
 from cudf.utils.dtypes import pandas_dtypes_to_cudf_dtypes
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+logger = logging.getLogger(__name__)
 
 
 class CSVReader(IOFuzz):
@@ -50,7 +47,7 @@ class CSVReader(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            seed = random.randint(0, 2 ** 32 - 1)
+            seed = _generate_rand_seed()
             random.seed(seed)
             dtypes_list = list(cudf.utils.dtypes.ALL_TYPES)
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
@@ -60,14 +57,15 @@ class CSVReader(IOFuzz):
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_columns"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
 
-        logging.info(f"Shape of DataFrame generated: {df.shape}")
+        logger.info("Shape of DataFrame generated: %s", df.shape)
         self._current_buffer = df
         return df.to_csv()
 
@@ -155,7 +153,7 @@ class CSVWriter(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            seed = random.randint(0, 2 ** 32 - 1)
+            seed = _generate_rand_seed()
             random.seed(seed)
             dtypes_list = list(cudf.utils.dtypes.ALL_TYPES)
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
@@ -165,14 +163,15 @@ class CSVWriter(IOFuzz):
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_columns"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
 
-        logging.info(f"Shape of DataFrame generated: {df.shape}")
+        logger.info("Shape of DataFrame generated: %s", df.shape)
         self._current_buffer = df
         return df
 
@@ -7,11 +7,7 @@ import os
 import sys
 import traceback
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+logger = logging.getLogger(__name__)
 
 
 class Fuzzer(object):
@@ -54,7 +50,7 @@ class Fuzzer(object):
         end_time = datetime.datetime.now()
         total_time_taken = end_time - self._start_time
 
-        logging.info(f"Run-Time elapsed (hh:mm:ss.ms) {total_time_taken}")
+        logger.info("Run-Time elapsed (hh:mm:ss.ms) %s", total_time_taken)
 
     def write_crash(self, error):
         error_file_name = datetime.datetime.now().__str__()
@@ -74,19 +70,26 @@ class Fuzzer(object):
                 self._data_handler.current_params, f, sort_keys=True, indent=4
             )
 
-        logging.info(f"Crash params was written to {crash_path}")
+        logger.info("Crash params was written to %s", crash_path)
 
         with open(crash_log_path, "w") as f:
             f.write(str(error))
-        logging.info(f"Crash exception was written to {crash_log_path}")
+        logger.info("Crash exception was written to %s", crash_log_path)
 
         if self.write_data_on_failure:
             self._data_handler.write_data(error_file_name)
 
     def start(self):
+        # Configure logging only once a fuzzing run actually starts, so that
+        # importing the fuzzing modules leaves the root logger untouched
+        logging.basicConfig(
+            format="%(asctime)s %(levelname)-8s %(message)s",
+            level=logging.INFO,
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
         while True:
-            logging.info(f"Running test {self._total_executions}")
+            logger.info("Running test %d", self._total_executions)
             file_name = self._data_handler.generate_input()
             try:
                 self._start_time = datetime.datetime.now()
@@ -95,20 +98,20 @@ class Fuzzer(object):
                 else:
                     self._data_handler.set_rand_params(self.params)
                     kwargs = self._data_handler._current_params["test_kwargs"]
-                    logging.info(f"Parameters passed: {str(kwargs)}")
+                    logger.info("Parameters passed: %s", kwargs)
                     self._target(file_name, **kwargs)
             except KeyboardInterrupt:
-                logging.info(
-                    f"Keyboard Interrupt encountered, stopping after "
-                    f"{self.runs} runs."
+                logger.info(
+                    "Keyboard Interrupt encountered, stopping after %d runs.",
+                    self.runs,
                 )
                 sys.exit(0)
             except Exception as e:
-                logging.exception(e)
+                logger.exception(e)
                 self.write_crash(traceback.format_exc())
             self.log_stats()
             if self.runs != -1 and self._total_executions >= self.runs:
-                logging.info(f"Completed {self.runs}, stopping now.")
+                logger.info("Completed %d, stopping now.", self.runs)
                 break
 
             self._total_executions += 1
@@ -9,14 +9,23 @@ import sys
 
 import numpy as np
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+logger = logging.getLogger(__name__)
 
 
 class IOFuzz(object):
+    __slots__ = (
+        "_inputs",
+        "_max_rows",
+        "_max_columns",
+        "_max_string_length",
+        "_max_lists_length",
+        "_max_lists_nesting_depth",
+        "_regression",
+        "_idx",
+        "_current_params",
+        "_current_buffer",
+    )
+
     def __init__(
         self,
         dirs=None,
@@ -70,7 +79,7 @@ class IOFuzz(object):
 
     def get_next_regression_params(self):
         if self._idx >= len(self._inputs):
-            logging.info(
+            logger.info(
                 "Reached the end of all crash.json files to run..Exiting.."
             )
             sys.exit(0)
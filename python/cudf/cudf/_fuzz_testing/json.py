@@ -1,43 +1,70 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 
+import functools
 import logging
 import random
 from collections import abc as abc
 
 import numpy as np
+from pyarrow import feather
 
 import cudf
 from cudf._fuzz_testing.io import IOFuzz
 from cudf._fuzz_testing.utils import (
     ALL_POSSIBLE_VALUES,
     _generate_rand_meta,
+    _generate_rand_seed,
     pyarrow_to_pandas,
 )
 from cudf.testing import dataset_generator as dg
 from cudf.utils.dtypes import pandas_dtypes_to_cudf_dtypes
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
+logger = logging.getLogger(__name__)
+
+_JSON_DTYPES_LIST = list(
+    cudf.utils.dtypes.ALL_TYPES
+    # https://github.com/pandas-dev/pandas/issues/20599
+    - {"uint64"}
+    # TODO: Remove DATETIME_TYPES after this is fixed:
+    # https://github.com/rapidsai/cudf/issues/6586
+    - set(cudf.utils.dtypes.DATETIME_TYPES)
 )
+# TODO: Uncomment following after following
+# issue is fixed:
+# https://github.com/rapidsai/cudf/issues/7086
+# _JSON_DTYPES_LIST.extend(["list"])
+
+_CUDF_DTYPE_STR = {
+    pd_dtype: str(cudf_dtype)
+    for pd_dtype, cudf_dtype in pandas_dtypes_to_cudf_dtypes.items()
+}
+
+
+def _get_dtype_str(dtype):
+    # Categorical dtypes carry random categories that are new in every fuzz
+    # iteration, so they are kept out of the cache below
+    if cudf.utils.dtypes.is_categorical_dtype(dtype):
+        return "category"
+    return _get_non_categorical_dtype_str(dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_non_categorical_dtype_str(dtype):
+    return _CUDF_DTYPE_STR.get(dtype) or str(dtype)
 
 
 def _get_dtype_param_value(dtype_val):
     if dtype_val is not None and isinstance(dtype_val, abc.Mapping):
-        processed_dtypes = {}
-        for col_name, dtype in dtype_val.items():
-            if cudf.utils.dtypes.is_categorical_dtype(dtype):
-                processed_dtypes[col_name] = "category"
-            else:
-                processed_dtypes[col_name] = str(
-                    pandas_dtypes_to_cudf_dtypes.get(dtype, dtype)
-                )
-        return processed_dtypes
+        return {
+            col_name: _get_dtype_str(dtype)
+            for col_name, dtype in dtype_val.items()
+        }
     return dtype_val
 
 
 class JSONReader(IOFuzz):
+    __slots__ = ("_current_json",)
+
     def __init__(
         self,
         dirs=None,
@@ -55,6 +82,7 @@ class JSONReader(IOFuzz):
             max_lists_length=max_lists_length,
             max_lists_nesting_depth=max_lists_nesting_depth,
         )
+        self._current_json = None
 
     def generate_input(self):
         if self._regression:
@@ -65,50 +93,42 @@ class JSONReader(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            seed = random.randint(0, 2 ** 32 - 1)
-            random.seed(seed)
-            dtypes_list = list(
-                cudf.utils.dtypes.ALL_TYPES
-                # https://github.com/pandas-dev/pandas/issues/20599
-                - {"uint64"}
-                # TODO: Remove DATETIME_TYPES after this is fixed:
-                # https://github.com/rapidsai/cudf/issues/6586
-                - set(cudf.utils.dtypes.DATETIME_TYPES)
-            )
-            # TODO: Uncomment following after following
-            # issue is fixed:
-            # https://github.com/rapidsai/cudf/issues/7086
-            # dtypes_list.extend(["list"])
+            seed = _generate_rand_seed()
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
-                self, dtypes_list
+                self, _JSON_DTYPES_LIST
             )
             self._current_params["dtypes_meta"] = dtypes_meta
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_columns"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
         self._current_buffer = df
-        logging.info(f"Shape of DataFrame generated: {df.shape}")
+        logger.info("Shape of DataFrame generated: %s", df.shape)
 
-        return df.to_json(orient="records", lines=True)
+        # pyarrow has no JSON writer, so the records still go through pandas,
+        # but they are encoded only once and reused for crash dumps.
+        self._current_json = df.to_json(orient="records", lines=True)
+        return self._current_json
 
     def write_data(self, file_name):
-        if self._current_buffer is not None:
-            self._current_buffer.to_json(
-                file_name + "_crash_json.json", orient="records", lines=True
-            )
+        if self._current_json is not None:
+            with open(file_name + "_crash_json.json", "w") as crash_dataset:
+                crash_dataset.write(self._current_json)
 
     def set_rand_params(self, params):
         params_dict = {}
         for param, values in params.items():
             if param == "dtype" and values == ALL_POSSIBLE_VALUES:
-                dtype_val = np.random.choice(
-                    [True, self._current_buffer.dtypes.to_dict()]
+                dtype_val = (
+                    self._current_buffer.dtypes.to_dict()
+                    if random.random() < 0.5
+                    else True
                 )
                 params_dict[param] = _get_dtype_param_value(dtype_val)
             else:
@@ -117,6 +137,8 @@ class JSONReader(IOFuzz):
 
 
 class JSONWriter(IOFuzz):
+    __slots__ = ("_current_table",)
+
     def __init__(
         self,
         dirs=None,
@@ -130,6 +152,7 @@ class JSONWriter(IOFuzz):
             max_columns=max_columns,
             max_string_length=max_string_length,
         )
+        self._current_table = None
 
     def generate_input(self):
         if self._regression:
@@ -140,50 +163,45 @@ class JSONWriter(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            seed = random.randint(0, 2 ** 32 - 1)
-            random.seed(seed)
-            dtypes_list = list(
-                cudf.utils.dtypes.ALL_TYPES
-                # https://github.com/pandas-dev/pandas/issues/20599
-                - {"uint64"}
-                # TODO: Remove DATETIME_TYPES after this is fixed:
-                # https://github.com/rapidsai/cudf/issues/6586
-                - set(cudf.utils.dtypes.DATETIME_TYPES)
-            )
-            # TODO: Uncomment following after following
-            # issue is fixed:
-            # https://github.com/rapidsai/cudf/issues/7086
-            # dtypes_list.extend(["list"])
+            seed = _generate_rand_seed()
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
-                self, dtypes_list
+                self, _JSON_DTYPES_LIST
             )
             self._current_params["dtypes_meta"] = dtypes_meta
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_columns"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
 
-        logging.info(f"Shape of DataFrame generated: {df.shape}")
+        logger.info("Shape of DataFrame generated: %s", df.shape)
         self._current_buffer = df
+        self._current_table = table
         return df
 
     def write_data(self, file_name):
-        if self._current_buffer is not None:
-            self._current_buffer.to_json(
-                file_name + "_crash_json.json", lines=True, orient="records"
+        # Dump the generated arrow table as-is rather than pushing it through
+        # pandas' row-wise JSON encoder; it can be re-encoded on demand.
+        if self._current_table is not None:
+            feather.write_feather(
+                self._current_table,
+                file_name + "_crash.feather",
+                compression="zstd",
             )
 
     def set_rand_params(self, params):
         params_dict = {}
         for param, values in params.items():
             if param == "dtype" and values == ALL_POSSIBLE_VALUES:
-                dtype_val = np.random.choice(
-                    [True, self._current_buffer.dtypes.to_dict()]
+                dtype_val = (
+                    self._current_buffer.dtypes.to_dict()
+                    if random.random() < 0.5
+                    else True
                 )
                 params_dict[param] = _get_dtype_param_value(dtype_val)
             else:
@@ -3,7 +3,6 @@
 import copy
 import io
 import logging
-import random
 
 import numpy as np
 import pyorc
@@ -13,16 +12,13 @@ from cudf._fuzz_testing.io import IOFuzz
 from cudf._fuzz_testing.utils import (
     ALL_POSSIBLE_VALUES,
     _generate_rand_meta,
+    _generate_rand_seed,
     pandas_to_orc,
     pyarrow_to_pandas,
 )
 from cudf.testing import dataset_generator as dg
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+logger = logging.getLogger(__name__)
 
 
 class OrcReader(IOFuzz):
@@ -69,17 +65,18 @@ class OrcReader(IOFuzz):
             )
 
             self._current_params["dtypes_meta"] = dtypes_meta
-            seed = random.randint(0, 2 ** 32 - 1)
+            seed = _generate_rand_seed()
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_cols"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
-        logging.info(f"Shape of DataFrame generated: {table.shape}")
+        logger.info("Shape of DataFrame generated: %s", table.shape)
         self._df = df
         file_obj = io.BytesIO()
         pandas_to_orc(
@@ -185,17 +182,18 @@ class OrcWriter(IOFuzz):
                 self, dtypes_list
             )
             self._current_params["dtypes_meta"] = dtypes_meta
-            seed = random.randint(0, 2 ** 32 - 1)
+            seed = _generate_rand_seed()
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_cols"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
-        logging.info(f"Shape of DataFrame generated: {table.shape}")
+        logger.info("Shape of DataFrame generated: %s", table.shape)
         self._df = df
         return df
 
@@ -1,7 +1,6 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 
 import logging
-import random
 
 import numpy as np
 
@@ -10,14 +9,30 @@ from cudf._fuzz_testing.io import IOFuzz
 from cudf._fuzz_testing.utils import (
     ALL_POSSIBLE_VALUES,
     _generate_rand_meta,
+    _generate_rand_seed,
     pyarrow_to_pandas,
 )
 from cudf.testing import dataset_generator as dg
 
-logging.basicConfig(
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
+logger = logging.getLogger(__name__)
+
+_PARQUET_READER_DTYPES_LIST = list(
+    cudf.utils.dtypes.ALL_TYPES
+    - {"category", "datetime64[ns]"}
+    - cudf.utils.dtypes.TIMEDELTA_TYPES
+    # TODO: Remove uint32 below after this bug is fixed
+    # https://github.com/pandas-dev/pandas/issues/37327
+    - {"uint32"}
+    | {"list", "decimal64"}
+)
+
+_PARQUET_WRITER_DTYPES_LIST = list(
+    cudf.utils.dtypes.ALL_TYPES
+    - {"category", "timedelta64[ns]", "datetime64[ns]"}
+    # TODO: Remove uint32 below after this bug is fixed
+    # https://github.com/pandas-dev/pandas/issues/37327
+    - {"uint32"}
+    | {"list", "decimal64"}
 )
 
 
@@ -50,30 +65,22 @@ class ParquetReader(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            dtypes_list = list(
-                cudf.utils.dtypes.ALL_TYPES
-                - {"category", "datetime64[ns]"}
-                - cudf.utils.dtypes.TIMEDELTA_TYPES
-                # TODO: Remove uint32 below after this bug is fixed
-                # https://github.com/pandas-dev/pandas/issues/37327
-                - {"uint32"}
-                | {"list", "decimal64"}
-            )
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
-                self, dtypes_list
+                self, _PARQUET_READER_DTYPES_LIST
             )
             self._current_params["dtypes_meta"] = dtypes_meta
-            seed = random.randint(0, 2 ** 32 - 1)
+            seed = _generate_rand_seed()
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_cols"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
-        logging.info(f"Shape of DataFrame generated: {table.shape}")
+        logger.info("Shape of DataFrame generated: %s", table.shape)
 
         # TODO: Change this to write into
         # a BytesIO object once below issue is fixed
@@ -137,32 +144,24 @@ class ParquetWriter(IOFuzz):
                 seed,
             ) = self.get_next_regression_params()
         else:
-            seed = random.randint(0, 2 ** 32 - 1)
-            random.seed(seed)
-            dtypes_list = list(
-                cudf.utils.dtypes.ALL_TYPES
-                - {"category", "timedelta64[ns]", "datetime64[ns]"}
-                # TODO: Remove uint32 below after this bug is fixed
-                # https://github.com/pandas-dev/pandas/issues/37327
-                - {"uint32"}
-                | {"list", "decimal64"}
-            )
+            seed = _generate_rand_seed()
             dtypes_meta, num_rows, num_cols = _generate_rand_meta(
-                self, dtypes_list
+                self, _PARQUET_WRITER_DTYPES_LIST
             )
             self._current_params["dtypes_meta"] = dtypes_meta
             self._current_params["seed"] = seed
             self._current_params["num_rows"] = num_rows
             self._current_params["num_columns"] = num_cols
-        logging.info(
-            f"Generating DataFrame with rows: {num_rows} "
-            f"and columns: {num_cols}"
+        logger.info(
+            "Generating DataFrame with rows: %d and columns: %d",
+            num_rows,
+            num_cols,
         )
 
         table = dg.rand_dataframe(dtypes_meta, num_rows, seed)
         df = pyarrow_to_pandas(table)
 
-        logging.info(f"Shape of DataFrame generated: {df.shape}")
+        logger.info("Shape of DataFrame generated: %s", df.shape)
         self._current_buffer = df
         return df
 
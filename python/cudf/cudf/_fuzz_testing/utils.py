@@ -1,5 +1,6 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 
+import os
 import random
 from collections import OrderedDict
 
@@ -71,6 +72,12 @@ ORC_TO_PANDAS_TYPES = {
 }
 
 
+def _generate_rand_seed():
+    # Drawn from the OS rather than the global random module, which
+    # dataset_generator reseeds with the previous seed on every call
+    return int.from_bytes(os.urandom(4), "little")
+
+
 def _generate_rand_meta(obj, dtypes_list, null_frequency_override=None):
     obj._current_params = {}
     num_rows = obj._rand(obj._max_rows)
@@ -152,17 +159,18 @@ def pyarrow_to_pandas(table):
     DataFrame
         A Pandas dataframe with nullable dtypes.
     """
-    df = pd.DataFrame()
-
-    for column in table.columns:
+    # Build all columns first and construct the frame once; inserting them
+    # one at a time makes pandas consolidate its blocks repeatedly.
+    data = {}
+    for name, column in zip(table.column_names, table.columns):
         if column.type in pyarrow_dtypes_to_pandas_dtypes:
-            df[column._name] = pd.Series(
+            data[name] = pd.Series(
                 column, dtype=pyarrow_dtypes_to_pandas_dtypes[column.type]
             )
         else:
-            df[column._name] = column.to_pandas()
+            data[name] = column.to_pandas()
 
-    return df
+    return pd.DataFrame(data)
 
 
 def compare_content(a, b):
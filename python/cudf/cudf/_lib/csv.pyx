@@ -11,6 +11,7 @@ import cudf
 import numpy as np
 
 from cudf._lib.cpp.types cimport size_type
+from cudf.core.dtypes import _cache_hashable_dtype_checks
 
 import collections.abc as abc
 import errno
@@ -220,6 +221,8 @@ cdef csv_reader_options make_csv_reader_options(
         if not isinstance(parse_dates, abc.Iterable):
             raise NotImplementedError(
                 "`parse_dates`: non-lists are unsupported")
+        c_infer_date_names.reserve(len(parse_dates))
+        c_infer_date_indexes.reserve(len(parse_dates))
         for col in parse_dates:
             if isinstance(col, str):
                 c_infer_date_names.push_back(str(col).encode())
@@ -236,9 +239,8 @@ cdef csv_reader_options make_csv_reader_options(
             c_dtypes.reserve(len(dtype))
             for k, v in dtype.items():
                 c_dtypes.push_back(
-                    str(
-                        str(k)+":"+
-                        _get_cudf_compatible_str_from_dtype(v)
+                    (
+                        str(k) + ":" + _get_cudf_compatible_str_from_dtype(v)
                     ).encode()
                 )
         elif (
@@ -395,14 +397,14 @@ def read_csv(
         c_result = move(cpp_read_csv(read_csv_options_c))
 
     meta_names = [name.decode() for name in c_result.metadata.column_names]
+    # Restore integer names up front rather than relabelling the frame.
+    if names is not None and isinstance(names[0], (int)):
+        meta_names = [int(x) for x in meta_names]
     df = cudf.DataFrame._from_table(Table.from_unique_ptr(
         move(c_result.tbl),
         column_names=meta_names
     ))
 
-    if names is not None and isinstance(names[0], (int)):
-        df.columns = [int(x) for x in df._data]
-
     # Set index if the index_col parameter is passed
     if index_col is not None and index_col is not False:
         if isinstance(index_col, int):
@@ -485,6 +487,10 @@ cpdef write_csv(
         cpp_write_csv(options)
 
 
+# Column dtypes are usually drawn from a handful of distinct values, so cache
+# their libcudf names instead of re-deriving them for every column. Only
+# hashable dtype specs are cached; e.g. cudf.CategoricalDtype is not hashable.
+@_cache_hashable_dtype_checks
 def _get_cudf_compatible_str_from_dtype(dtype):
     # TODO: Remove this Error message once the
     # following issue is fixed:
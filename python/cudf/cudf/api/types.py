@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import datetime
 from collections.abc import Sequence
 from functools import wraps
 from inspect import isclass
@@ -17,6 +18,7 @@ import cudf
 from cudf._lib.scalar import DeviceScalar
 from cudf.core.dtypes import (  # noqa: F401
     _BaseDtype,
+    _cache_hashable_dtype_checks,
     is_categorical_dtype,
     is_decimal32_dtype,
     is_decimal64_dtype,
@@ -27,6 +29,7 @@ from cudf.core.dtypes import (  # noqa: F401
 )
 
 
+@_cache_hashable_dtype_checks
 def is_numeric_dtype(obj):
     """Check whether the provided array or dtype is of a numeric dtype.
 
@@ -86,6 +89,7 @@ def is_integer(obj):
     return pd.api.types.is_integer(obj)
 
 
+@_cache_hashable_dtype_checks
 def is_string_dtype(obj):
     """Check whether the provided array or dtype is of the string dtype.
 
@@ -99,6 +103,12 @@ def is_string_dtype(obj):
     bool
         Whether or not the array or dtype is of the string dtype.
     """
+    # Fast paths for the most common inputs: numpy dtypes are strings exactly
+    # when pandas would say so, and cudf extension dtypes never are.
+    if isinstance(obj, np.dtype):
+        return obj.kind in ("O", "S", "U")
+    if isinstance(obj, _BaseDtype):
+        return False
     return (
         pd.api.types.is_string_dtype(obj)
         # Reject all cudf extension types.
@@ -110,6 +120,44 @@ def is_string_dtype(obj):
     )
 
 
+# Exact types that are always scalars, checked before falling back to the
+# more general (and slower) isinstance-based checks in `is_scalar`.
+_SCALAR_TYPES = frozenset(
+    (
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        datetime.datetime,
+        datetime.timedelta,
+        pd.Timestamp,
+        pd.Timedelta,
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float16,
+        np.float32,
+        np.float64,
+        np.complex64,
+        np.complex128,
+        np.datetime64,
+        np.timedelta64,
+        np.str_,
+        np.bytes_,
+        DeviceScalar,
+    )
+)
+
+
 def is_scalar(val):
     """Return True if given object is scalar.
 
@@ -123,6 +171,8 @@ def is_scalar(val):
     bool
         Return True if given object is scalar.
     """
+    if type(val) in _SCALAR_TYPES:
+        return True
     return (
         isinstance(val, DeviceScalar)
         or isinstance(val, cudf.Scalar)
@@ -192,6 +242,25 @@ def _wrap_pandas_is_dtype_api(func):
     return wrapped_func
 
 
+def _wrap_numpy_kind_check(kind, func):
+    """Short-circuit a dtype check for numpy dtypes using their kind code.
+
+    Objects that are (or are backed by) a numpy dtype are classified by a
+    single character comparison; anything else is forwarded to `func`.
+    """
+
+    @wraps(func)
+    def wrapped_func(obj):
+        if isinstance(obj, np.dtype):
+            return obj.kind == kind
+        dtype = getattr(obj, "dtype", None)
+        if isinstance(dtype, np.dtype):
+            return dtype.kind == kind
+        return func(obj)
+
+    return wrapped_func
+
+
 def _union_categoricals(
     to_union: List[Union[cudf.Series, cudf.Index]],
     sort_categories: bool = False,
@@ -231,26 +300,40 @@ def _union_categoricals(
 # union_categoricals = pd_types.union_categoricals
 infer_dtype = pd_types.infer_dtype
 pandas_dtype = pd_types.pandas_dtype
-is_bool_dtype = pd_types.is_bool_dtype
+is_bool_dtype = _cache_hashable_dtype_checks(pd_types.is_bool_dtype)
 is_complex_dtype = pd_types.is_complex_dtype
 # TODO: Evaluate which of the datetime types need special handling for cudf.
-is_datetime_dtype = _wrap_pandas_is_dtype_api(pd_types.is_datetime64_dtype)
+is_datetime_dtype = _cache_hashable_dtype_checks(
+    _wrap_numpy_kind_check(
+        "M", _wrap_pandas_is_dtype_api(pd_types.is_datetime64_dtype)
+    )
+)
 is_datetime64_any_dtype = pd_types.is_datetime64_any_dtype
 is_datetime64_dtype = pd_types.is_datetime64_dtype
 is_datetime64_ns_dtype = pd_types.is_datetime64_ns_dtype
 is_datetime64tz_dtype = pd_types.is_datetime64tz_dtype
 is_extension_type = pd_types.is_extension_type
 is_extension_array_dtype = pd_types.is_extension_array_dtype
-is_float_dtype = pd_types.is_float_dtype
+is_float_dtype = _cache_hashable_dtype_checks(pd_types.is_float_dtype)
 is_int64_dtype = pd_types.is_int64_dtype
-is_integer_dtype = _wrap_pandas_is_dtype_api(pd_types.is_integer_dtype)
+is_integer_dtype = _cache_hashable_dtype_checks(
+    _wrap_pandas_is_dtype_api(pd_types.is_integer_dtype)
+)
 is_object_dtype = pd_types.is_object_dtype
 is_period_dtype = pd_types.is_period_dtype
-is_signed_integer_dtype = pd_types.is_signed_integer_dtype
-is_timedelta_dtype = _wrap_pandas_is_dtype_api(pd_types.is_timedelta64_dtype)
+is_signed_integer_dtype = _cache_hashable_dtype_checks(
+    pd_types.is_signed_integer_dtype
+)
+is_timedelta_dtype = _cache_hashable_dtype_checks(
+    _wrap_numpy_kind_check(
+        "m", _wrap_pandas_is_dtype_api(pd_types.is_timedelta64_dtype)
+    )
+)
 is_timedelta64_dtype = pd_types.is_timedelta64_dtype
 is_timedelta64_ns_dtype = pd_types.is_timedelta64_ns_dtype
-is_unsigned_integer_dtype = pd_types.is_unsigned_integer_dtype
+is_unsigned_integer_dtype = _cache_hashable_dtype_checks(
+    pd_types.is_unsigned_integer_dtype
+)
 is_sparse = pd_types.is_sparse
 # is_list_like = pd_types.is_list_like
 is_dict_like = pd_types.is_dict_like
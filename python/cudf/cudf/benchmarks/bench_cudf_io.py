@@ -2,10 +2,16 @@
 
 import pytest
 import cudf
+import functools
 import glob
 import io
+import os
+import re
 from conftest import option
 
+# Number of timed rounds for benchmarks reading from in-memory buffers.
+BUFFER_ROUNDS = 10
+
 
 def get_dataset_dir():
     if option.dataset_dir == "NONE":
@@ -13,47 +19,79 @@ def get_dataset_dir():
     return option.dataset_dir
 
 
+DATASET_DIR = get_dataset_dir()
+
+
+@functools.lru_cache(maxsize=None)
+def get_dataset_files(pattern):
+    return glob.glob(os.path.join(DATASET_DIR, pattern))
+
+
+@functools.lru_cache(maxsize=1)
+def read_file_bytes(file_path):
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def run_reader_benchmark(benchmark, reader, file_path, use_buffer, **kwargs):
+    if use_buffer == "True":
+        data = read_file_bytes(file_path)
+
+        def setup():
+            # Each round needs an unread buffer. ``BytesIO`` shares ``data``
+            # until it is written to, so this does not copy the file and
+            # keeps disk I/O out of the timed region.
+            return (io.BytesIO(data),), kwargs
+
+        benchmark.pedantic(reader, setup=setup, rounds=BUFFER_ROUNDS)
+    else:
+        benchmark(reader, file_path, **kwargs)
+
+
 @pytest.mark.parametrize("skiprows", [None, 100000, 200000])
-@pytest.mark.parametrize("file_path", glob.glob(get_dataset_dir() + "avro_*"))
+@pytest.mark.parametrize("file_path", get_dataset_files("avro_*"))
 def bench_avro(benchmark, file_path, use_buffer, skiprows):
+    run_reader_benchmark(
+        benchmark, cudf.read_avro, file_path, use_buffer, skiprows=skiprows
+    )
 
-    if use_buffer == "True":
-        with open(file_path, "rb") as f:
-            file_path = io.BytesIO(f.read())
-    benchmark(cudf.read_avro, file_path, skiprows=skiprows)
+
+_DTYPES = {
+    "unsigned_int": ("uint8", "uint16", "uint32", "uint64") * 16,
+    "int": ("int8", "int16", "int32", "int64") * 16,
+    "float": ("float32", "float64") * 32,
+    "str": ("str",) * 64,
+    "datetime64": (
+        "timestamp[s]",
+        "timestamp[ms]",
+        "timestamp[us]",
+        "timestamp[ns]",
+    )
+    * 16,
+    "timedelta64": (
+        "timedelta64[s]",
+        "timedelta64[ms]",
+        "timedelta64[us]",
+        "timedelta64[ns]",
+    )
+    * 16,
+    "bool": ("bool",) * 64,
+}
+_DTYPES_KEY_RE = re.compile(
+    r"_(unsigned_int|int|float|str|datetime64|timedelta64|bool)_"
+)
 
 
 def get_dtypes(file_path):
-    if "_unsigned_int_" in file_path:
-        return ["uint8", "uint16", "uint32", "uint64"] * 16
-    elif "_int_" in file_path:
-        return ["int8", "int16", "int32", "int64"] * 16
-    elif "_float_" in file_path:
-        return ["float32", "float64"] * 32
-    elif "_str_" in file_path:
-        return ["str"] * 64
-    elif "_datetime64_" in file_path:
-        return [
-            "timestamp[s]",
-            "timestamp[ms]",
-            "timestamp[us]",
-            "timestamp[ns]",
-        ] * 16
-    elif "_timedelta64_" in file_path:
-        return [
-            "timedelta64[s]",
-            "timedelta64[ms]",
-            "timedelta64[us]",
-            "timedelta64[ns]",
-        ] * 16
-    elif "_bool_" in file_path:
-        return ["bool"] * 64
-    else:
+    # Only the file name encodes the dtype; the directory may be user supplied
+    match = _DTYPES_KEY_RE.search(os.path.basename(file_path))
+    if match is None:
         raise TypeError("Unsupported dtype file")
+    return list(_DTYPES[match.group(1)])
 
 
 @pytest.mark.parametrize("dtype", ["infer", "provide"])
-@pytest.mark.parametrize("file_path", glob.glob(get_dataset_dir() + "json_*"))
+@pytest.mark.parametrize("file_path", get_dataset_files("json_*"))
 def bench_json(benchmark, file_path, use_buffer, dtype):
     if "bz2" in file_path:
         compression = "bz2"
@@ -69,13 +107,11 @@ def bench_json(benchmark, file_path, use_buffer, dtype):
     else:
         dtype = get_dtypes(file_path)
 
-    if use_buffer == "True":
-        with open(file_path, "rb") as f:
-            file_path = io.BytesIO(f.read())
-
-    benchmark(
+    run_reader_benchmark(
+        benchmark,
         cudf.read_json,
         file_path,
+        use_buffer,
         engine="cudf",
         compression=compression,
         lines=True,
@@ -1,6 +1,7 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 """Common abstract base classes for cudf."""
 
+import functools
 import sys
 
 import rmm
@@ -16,6 +17,18 @@ else:
     import pickle  # type: ignore
 
 
+@functools.lru_cache(maxsize=128)
+def _pickle_type(typ):
+    """Pickle a class, reusing the result for classes seen before."""
+    return pickle.dumps(typ)
+
+
+@functools.lru_cache(maxsize=128)
+def _unpickle_type(serialized):
+    """Unpickle a class, reusing the result for payloads seen before."""
+    return pickle.loads(serialized)
+
+
 class Serializable:
     """A serializable object composed of device memory buffers.
 
@@ -95,14 +108,18 @@ class Serializable:
         :meta private:
         """
         header, frames = self.serialize()
-        assert all(
-            (type(f) in [cudf.core.buffer.Buffer, memoryview]) for f in frames
-        )
-        header["type-serialized"] = pickle.dumps(type(self))
-        header["is-cuda"] = [
-            hasattr(f, "__cuda_array_interface__") for f in frames
-        ]
-        header["lengths"] = [f.nbytes for f in frames]
+        header["type-serialized"] = _pickle_type(type(self))
+        is_cuda = []
+        lengths = []
+        for f in frames:
+            assert type(f) in (cudf.core.buffer.Buffer, memoryview)
+            is_cuda.append(
+                isinstance(f, cudf.core.buffer.Buffer)
+                or hasattr(f, "__cuda_array_interface__")
+            )
+            lengths.append(f.nbytes)
+        header["is-cuda"] = is_cuda
+        header["lengths"] = lengths
         return header, frames
 
     @classmethod
@@ -128,18 +145,16 @@ class Serializable:
 
         :meta private:
         """
-        typ = pickle.loads(header["type-serialized"])
-        frames = [
-            cudf.core.buffer.Buffer(f) if c else memoryview(f)
-            for c, f in zip(header["is-cuda"], frames)
-        ]
-        assert all(
-            (type(f._owner) is rmm.DeviceBuffer)
-            if c
-            else (type(f) is memoryview)
-            for c, f in zip(header["is-cuda"], frames)
-        )
-        obj = typ.deserialize(header, frames)
+        typ = _unpickle_type(header["type-serialized"])
+        device_frames = []
+        for is_cuda, f in zip(header["is-cuda"], frames):
+            if is_cuda:
+                f = cudf.core.buffer.Buffer(f)
+                assert type(f._owner) is rmm.DeviceBuffer
+            else:
+                f = memoryview(f)
+            device_frames.append(f)
+        obj = typ.deserialize(header, device_frames)
 
         return obj
 
@@ -2,8 +2,6 @@
 from __future__ import annotations
 
 import functools
-import operator
-import pickle
 from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
@@ -11,7 +9,7 @@ import numpy as np
 import rmm
 from rmm import DeviceBuffer
 
-from cudf.core.abc import Serializable
+from cudf.core.abc import Serializable, _pickle_type
 
 
 class Buffer(Serializable):
@@ -38,6 +36,8 @@ class Buffer(Serializable):
             allocation is tied. If provided, a reference to this
             object is kept in this Buffer.
         """
+        # Cheap type checks come first; the array interface probes below
+        # are comparatively expensive attribute lookups.
         if isinstance(data, Buffer):
             self.ptr = data.ptr
             self.size = data.size
@@ -46,10 +46,6 @@ class Buffer(Serializable):
             self.ptr = data.ptr
             self.size = data.size
             self._owner = data
-        elif hasattr(data, "__array_interface__") or hasattr(
-            data, "__cuda_array_interface__"
-        ):
-            self._init_from_array_like(data, owner)
         elif isinstance(data, memoryview):
             self._init_from_array_like(np.asarray(data), owner)
         elif isinstance(data, int):
@@ -62,6 +58,10 @@ class Buffer(Serializable):
             self.ptr = 0
             self.size = 0
             self._owner = None
+        elif hasattr(data, "__cuda_array_interface__") or hasattr(
+            data, "__array_interface__"
+        ):
+            self._init_from_array_like(data, owner)
         else:
             try:
                 data = memoryview(data)
@@ -116,7 +116,7 @@ class Buffer(Serializable):
 
     def serialize(self) -> Tuple[dict, list]:
         header = {}  # type: Dict[Any, Any]
-        header["type-serialized"] = pickle.dumps(type(self))
+        header["type-serialized"] = _pickle_type(type(self))
         header["constructor-kwargs"] = {}
         header["desc"] = self.__cuda_array_interface__.copy()
         header["desc"]["strides"] = (1,)
@@ -153,22 +153,30 @@ class Buffer(Serializable):
         return out
 
 
+@functools.lru_cache(maxsize=None)
+def _itemsize(typestr):
+    return np.dtype(typestr).itemsize
+
+
 def _buffer_data_from_array_interface(array_interface):
     ptr = array_interface["data"][0]
     if ptr is None:
         ptr = 0
-    itemsize = np.dtype(array_interface["typestr"]).itemsize
-    shape = (
-        array_interface["shape"] if len(array_interface["shape"]) > 0 else (1,)
-    )
-    size = functools.reduce(operator.mul, shape)
+    itemsize = _itemsize(array_interface["typestr"])
+    shape = array_interface["shape"]
+    if len(shape) == 1:
+        size = shape[0]
+    else:
+        size = 1
+        for dim in shape:
+            size *= dim
     return ptr, size * itemsize
 
 
 def confirm_1d_contiguous(array_interface):
     strides = array_interface["strides"]
     shape = array_interface["shape"]
-    itemsize = np.dtype(array_interface["typestr"]).itemsize
+    itemsize = _itemsize(array_interface["typestr"])
     typestr = array_interface["typestr"]
     if typestr not in ("|i1", "|u1"):
         raise TypeError("Buffer data must be of uint8 type")
@@ -71,29 +71,35 @@ class IntervalColumn(StructColumn):
             struct_arrow = pa.array([], typ.storage_type)
         return pa.ExtensionArray.from_storage(typ, struct_arrow)
 
-    def from_struct_column(self, closed="right"):
-        first_field_name = list(self.dtype.fields.keys())[0]
+    @staticmethod
+    def _from_struct(struct_col, dtype, closed):
+        """Wrap the buffers of ``struct_col`` in an ``IntervalColumn``.
+
+        ``dtype`` is reused as long as its ``closed`` matches ``closed``.
+        """
+        if dtype.closed != closed:
+            dtype = IntervalDtype(dtype.fields["left"], closed)
         return IntervalColumn(
-            size=self.size,
-            dtype=IntervalDtype(self.dtype.fields[first_field_name], closed),
-            mask=self.base_mask,
-            offset=self.offset,
-            null_count=self.null_count,
-            children=self.base_children,
+            size=struct_col.size,
+            dtype=dtype,
+            mask=struct_col.base_mask,
+            offset=struct_col.offset,
+            null_count=struct_col.null_count,
+            children=struct_col.base_children,
             closed=closed,
         )
 
+    def from_struct_column(self, closed="right"):
+        first_field_name = list(self.dtype.fields.keys())[0]
+        return IntervalColumn._from_struct(
+            self,
+            IntervalDtype(self.dtype.fields[first_field_name], closed),
+            closed,
+        )
+
     def copy(self, deep=True):
-        closed = self.closed
-        struct_copy = super().copy(deep=deep)
-        return IntervalColumn(
-            size=struct_copy.size,
-            dtype=IntervalDtype(struct_copy.dtype.fields["left"], closed),
-            mask=struct_copy.base_mask,
-            offset=struct_copy.offset,
-            null_count=struct_copy.null_count,
-            children=struct_copy.base_children,
-            closed=closed,
+        return self._from_struct(
+            super().copy(deep=deep), self.dtype, self.closed
         )
 
     def as_interval_column(self, dtype, **kwargs):
@@ -101,16 +107,8 @@ class IntervalColumn(StructColumn):
             # a user can directly input the string `interval` as the dtype
             # when creating an interval series or interval dataframe
             if dtype == "interval":
-                dtype = IntervalDtype(self.dtype.fields["left"], self.closed)
-            return IntervalColumn(
-                size=self.size,
-                dtype=dtype,
-                mask=self.mask,
-                offset=self.offset,
-                null_count=self.null_count,
-                children=self.children,
-                closed=dtype.closed,
-            )
+                return self._from_struct(self, self.dtype, self.closed)
+            return self._from_struct(self, dtype, dtype.closed)
         else:
             raise ValueError("dtype must be IntervalDtype")
 
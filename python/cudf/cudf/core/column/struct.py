@@ -4,11 +4,22 @@ from __future__ import annotations
 import pyarrow as pa
 
 import cudf
+from cudf import _lib as libcudf
 from cudf._typing import Dtype
 from cudf.core.column import ColumnBase, build_struct_column
 from cudf.core.column.methods import ColumnMethodsMixin
 from cudf.core.dtypes import StructDtype
-from cudf.utils.dtypes import is_struct_dtype
+from cudf.utils.dtypes import cudf_dtype_from_pa_type, is_struct_dtype
+
+# Arrow types that ``as_column`` converts with cudf-specific handling
+# rather than a plain libcudf ``from_arrow`` call.
+_ARROW_TYPES_REQUIRING_DISPATCH = (
+    pa.DictionaryType,
+    pa.StructType,
+    pa.Decimal128Type,
+    pa.ExtensionType,
+    pa.NullType,
+)
 
 
 class StructColumn(ColumnBase):
@@ -40,10 +51,25 @@ class StructColumn(ColumnBase):
 
         offset = data.offset
         null_count = data.null_count
-        children = tuple(
-            cudf.core.column.as_column(data.field(i))
-            for i in range(data.type.num_fields)
-        )
+        fields = [data.field(i) for i in range(data.type.num_fields)]
+        children = [None] * len(fields)
+
+        # Move every plain field to the device with a single libcudf call
+        # instead of building a one-column table per field.
+        names = []
+        for i, field in enumerate(fields):
+            if isinstance(field.type, _ARROW_TYPES_REQUIRING_DISPATCH):
+                children[i] = cudf.core.column.as_column(field)
+            else:
+                names.append(str(i))
+        if names:
+            table = pa.table([fields[int(name)] for name in names], names)
+            result = libcudf.interop.from_arrow(table, names)
+            for name in names:
+                i = int(name)
+                children[i] = result._data[name]._with_type_metadata(
+                    cudf_dtype_from_pa_type(fields[i].type)
+                )
         return StructColumn(
             data=None,
             size=size,
@@ -51,7 +77,7 @@ class StructColumn(ColumnBase):
             mask=mask,
             offset=offset,
             null_count=null_count,
-            children=children,
+            children=tuple(children),
         )
 
     def to_arrow(self):
@@ -69,10 +95,10 @@ class StructColumn(ColumnBase):
             }
         )
 
-        if self.nullable:
-            nbuf = self.mask.to_host_array().view("int8")
-            nbuf = pa.py_buffer(nbuf)
-            buffers = (nbuf,)
+        # Arrow treats a missing validity buffer as all-valid, so the mask
+        # only has to be copied to host when it actually masks something.
+        if self.nullable and self.null_count:
+            buffers = (pa.py_buffer(self.mask.to_host_array()),)
         else:
             buffers = (None,)
 
@@ -1,4 +1,5 @@
 from cudf._lib.labeling import label_bins
+from cudf._lib.reduce import minmax
 from cudf.core.column import as_column
 from cudf.core.column import build_categorical_column
 from cudf.core.index import IntervalIndex, interval_range
@@ -141,12 +142,21 @@ def cut(
     elif isinstance(bins, (pd.IntervalIndex, cudf.IntervalIndex)):
         right = bins.closed == "right"
 
+    input_arr = None
+
     # create bins if given an int or single scalar
     if not isinstance(bins, pd.IntervalIndex):
         if not isinstance(bins, (Sequence)):
-            if isinstance(
-                x, (pd.Series, cudf.Series, np.ndarray, cupy.ndarray)
-            ):
+            if isinstance(x, cudf.Series):
+                # compute both extrema in a single pass over the device data
+                # and keep the column around as the input to `label_bins`.
+                # NaNs are skipped like nulls, as Series.min/max would.
+                input_arr = as_column(x)
+                mn, mx = (
+                    extremum.value
+                    for extremum in minmax(input_arr.nans_to_nulls())
+                )
+            elif isinstance(x, (pd.Series, np.ndarray, cupy.ndarray)):
                 mn = x.min()
                 mx = x.max()
             else:
@@ -169,12 +179,14 @@ def cut(
             right_edge = bins[-1]
             x = cupy.asarray(x)
             x[x == right_edge] = right_edge + 1
+            input_arr = None
 
         # adjust bin edges decimal precision
         int_label_bins = np.around(bins, precision)
 
     # the inputs is a column of the values in the array x
-    input_arr = as_column(x)
+    if input_arr is None:
+        input_arr = as_column(x)
 
     # checking for the correct inclusivity values
     if right:
@@ -233,11 +245,14 @@ def cut(
         left_edges = as_column(bins.left).astype(input_arr.dtype)
         right_edges = as_column(bins.right).astype(input_arr.dtype)
     else:
-        # get the left and right edges of the bins as columns
-        left_edges = as_column(bins[:-1:], dtype="float64")
-        right_edges = as_column(bins[+1::], dtype="float64")
+        # get the left and right edges of the bins as columns; both are
+        # zero-copy slices of a single device copy of the bin edges
+        bins_col = as_column(bins, dtype="float64")
+        left_edges = bins_col[:-1]
+        right_edges = bins_col[1:]
         # the input arr must be changed to the same type as the edges
-        input_arr = input_arr.astype(left_edges.dtype)
+        if input_arr.dtype != left_edges.dtype:
+            input_arr = input_arr.astype(left_edges.dtype)
     # get the indexes for the appropriate number
     index_labels = label_bins(
         input_arr, left_edges, left_inclusive, right_edges, right_inclusive
@@ -279,17 +294,18 @@ def cut(
         ordered=ordered,
     )
 
-    # we return a categorical index, as we don't have a Categorical method
-    categorical_index = cudf.core.index.as_index(col)
-
     if isinstance(orig_x, (pd.Series, cudf.Series)):
         # if we have a series input we return a series output
-        res_series = cudf.Series(categorical_index, index=orig_x.index)
+        res_series = cudf.Series(col, index=orig_x.index)
         if retbins:
             return res_series, bins
         else:
             return res_series
-    elif retbins:
+
+    # we return a categorical index, as we don't have a Categorical method;
+    # col is already categorical, so build the index from it directly
+    categorical_index = cudf.CategoricalIndex._from_data({None: col})
+    if retbins:
         # if retbins is true we return the bins as well
         return categorical_index, bins
     else:
@@ -1,6 +1,7 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 
 import decimal
+import functools
 import pickle
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -560,6 +561,42 @@ class IntervalDtype(StructDtype):
         )
 
 
+def _cache_hashable_dtype_checks(func):
+    """Memoize a dtype predicate for strings, numpy dtypes and classes.
+
+    Other inputs (arrays, Series, Index, columns, ...) are not reliably
+    hashable and are always forwarded to the undecorated predicate.
+    """
+    cached_func = functools.lru_cache(maxsize=512, typed=True)(func)
+
+    @functools.wraps(func)
+    def wrapped_func(obj):
+        if isinstance(obj, (str, np.dtype, type)):
+            return cached_func(obj)
+        return func(obj)
+
+    wrapped_func.cache_clear = cached_func.cache_clear
+    wrapped_func.cache_info = cached_func.cache_info
+    return wrapped_func
+
+
+# Exact types for which `is_categorical_dtype` can be answered with a single
+# lookup instead of walking the full chain of checks. Subclasses and other
+# objects still go through the complete logic.
+_CATEGORICAL_TYPES = frozenset(
+    (
+        pd_CategoricalDtype,
+        CategoricalDtype,
+        pd.Categorical,
+        pd.CategoricalIndex,
+    )
+)
+_NON_CATEGORICAL_TYPES = frozenset(
+    [np.ndarray] + [type(np.dtype(code)) for code in np.typecodes["All"]]
+)
+
+
+@_cache_hashable_dtype_checks
 def is_categorical_dtype(obj):
     """Check whether an array-like or dtype is of the Categorical dtype.
 
@@ -576,6 +613,12 @@ def is_categorical_dtype(obj):
     if obj is None:
         return False
 
+    obj_type = type(obj)
+    if obj_type in _CATEGORICAL_TYPES:
+        return True
+    if obj_type in _NON_CATEGORICAL_TYPES:
+        return False
+
     if isinstance(
         obj,
         (
@@ -624,6 +667,7 @@ def is_categorical_dtype(obj):
     return pd_types.is_categorical_dtype(obj)
 
 
+@_cache_hashable_dtype_checks
 def is_list_dtype(obj):
     """Check whether an array-like or dtype is of the list dtype.
 
@@ -647,6 +691,7 @@ def is_list_dtype(obj):
     )
 
 
+@_cache_hashable_dtype_checks
 def is_struct_dtype(obj):
     """Check whether an array-like or dtype is of the struct dtype.
 
@@ -673,6 +718,7 @@ def is_struct_dtype(obj):
     )
 
 
+@_cache_hashable_dtype_checks
 def is_decimal_dtype(obj):
     """Check whether an array-like or dtype is of the decimal dtype.
 
@@ -689,6 +735,7 @@ def is_decimal_dtype(obj):
     return is_decimal32_dtype(obj) or is_decimal64_dtype(obj)
 
 
+@_cache_hashable_dtype_checks
 def is_interval_dtype(obj):
     """Check whether an array-like or dtype is of the interval dtype.
 
@@ -28,6 +28,8 @@ class _Indexer:
     # >>> _Indexer("a", column=True).get(df)  # returns column "a" of df
     # >>> _Indexer("b", index=True).get(df)  # returns index level "b" of df
 
+    __slots__ = ("name", "column", "index")
+
     def __init__(self, name: Any, column=False, index=False):
         if column and index:
             raise ValueError("Cannot specify both column and index")
@@ -5,8 +5,11 @@ import functools
 from collections import namedtuple
 from typing import TYPE_CHECKING, Callable, Tuple
 
+import numpy as np
+
 import cudf
 from cudf import _lib as libcudf
+from cudf._lib.reduce import minmax
 from cudf.core.join._join_helpers import (
     _coerce_to_tuple,
     _frame_select_by_indexers,
@@ -56,6 +59,11 @@ def merge(
 
 _JoinKeys = namedtuple("JoinKeys", ["left", "right"])
 
+# The probe side of an inner or left-semi join is only pre-filtered on the
+# key range of the build side when it is at least this many times longer,
+# so that the extra reductions and boolean mask pay for themselves.
+_PROBE_FILTER_MIN_RATIO = 10
+
 
 class Merge(object):
     # A namedtuple of indexers representing the left and right keys
@@ -143,6 +151,10 @@ class Merge(object):
         self.on = on
         self.left_on = left_on
         self.right_on = right_on
+        # The key labels normalized to tuples, computed once per merge
+        self._on = _coerce_to_tuple(on) if on else ()
+        self._left_on = _coerce_to_tuple(left_on) if left_on else ()
+        self._right_on = _coerce_to_tuple(right_on) if right_on else ()
         self.left_index = left_index
         self.right_index = right_index
         self.how = how
@@ -166,6 +178,7 @@ class Merge(object):
 
     def perform_merge(self) -> Frame:
         lhs, rhs = self._match_key_dtypes(self.lhs, self.rhs)
+        lhs, rhs = self._filter_probe_by_key_range(lhs, rhs)
 
         left_table = _frame_select_by_indexers(lhs, self._keys.left)
         right_table = _frame_select_by_indexers(rhs, self._keys.right)
@@ -184,6 +197,7 @@ class Merge(object):
                 left_rows, nullify=True, keep_index=gather_index
             )
         if right_rows is not None:
+            rhs = self._drop_duplicate_key_columns(lhs, rhs)
             right_result = rhs._gather(
                 right_rows, nullify=True, keep_index=gather_index
             )
@@ -216,7 +230,7 @@ class Merge(object):
                 left_keys.extend(
                     [
                         _Indexer(name=on, column=True)
-                        for on in _coerce_to_tuple(self.left_on)
+                        for on in self._left_on
                     ]
                 )
             if self.right_index:
@@ -231,11 +245,11 @@ class Merge(object):
                 right_keys.extend(
                     [
                         _Indexer(name=on, column=True)
-                        for on in _coerce_to_tuple(self.right_on)
+                        for on in self._right_on
                     ]
                 )
         elif self.on:
-            on_names = _coerce_to_tuple(self.on)
+            on_names = self._on
             for on in on_names:
                 # If `on` is provided, Merge on columns if present,
                 # otherwise default to indexes.
@@ -282,48 +296,37 @@ class Merge(object):
                         validate=False,
                     )
 
-        # Compute the result column names:
-        # left_names and right_names will be a mappings of input column names
-        # to the corresponding names in the final result.
-        left_names = dict(zip(left_result._data, left_result._data))
-        right_names = dict(zip(right_result._data, right_result._data))
-
         # For any columns from left_result and right_result that have the same
         # name:
         # - if they are key columns, keep only the left column
         # - if they are not key columns, use suffixes to differentiate them
         #   in the final result
-        common_names = set(left_names) & set(right_names)
-
-        if self.on:
-            key_columns_with_same_name = self.on
-        else:
-            key_columns_with_same_name = [
-                lkey.name
-                for lkey, rkey in zip(*self._keys)
-                if (
-                    (lkey.index, rkey.index) == (False, False)
-                    and lkey.name == rkey.name
-                )
-            ]
-        for name in common_names:
-            if name not in key_columns_with_same_name:
-                left_names[name] = f"{name}{self.lsuffix}"
-                right_names[name] = f"{name}{self.rsuffix}"
-            else:
-                del right_names[name]
-
-        # Assemble the data columns of the result:
-        data = left_result._data.__class__()
-
-        for lcol in left_names:
-            data.set_by_label(
-                left_names[lcol], left_result._data[lcol], validate=False
-            )
-        for rcol in right_names:
-            data.set_by_label(
-                right_names[rcol], right_result._data[rcol], validate=False
-            )
+        # left_renames and right_renames map only those names to the names
+        # used in the final result; all other columns keep their name.
+        left_renames = {}
+        right_renames = {}
+        right_dropped = set()
+        common_names = left_result._data.keys() & right_result._data.keys()
+        if common_names:
+            key_columns_with_same_name = self._key_columns_with_same_name()
+            for name in common_names:
+                if name not in key_columns_with_same_name:
+                    left_renames[name] = f"{name}{self.lsuffix}"
+                    right_renames[name] = f"{name}{self.rsuffix}"
+                else:
+                    right_dropped.add(name)
+
+        # Assemble the data columns of the result in a single pass:
+        columns = {
+            left_renames.get(name, name): col
+            for name, col in left_result._data.items()
+        }
+        columns.update(
+            (right_renames.get(name, name), col)
+            for name, col in right_result._data.items()
+            if name not in right_dropped
+        )
+        data = left_result._data.__class__._create_unsafe(columns)
 
         # Index of the result:
         if self.left_index and self.right_index:
@@ -342,6 +345,42 @@ class Merge(object):
 
         return result
 
+    def _key_columns_with_same_name(self):
+        # Names of the key columns that appear on both sides and therefore
+        # only once in the result
+        if self.on:
+            return self._on
+        return [
+            lkey.name
+            for lkey, rkey in zip(*self._keys)
+            if (
+                (lkey.index, rkey.index) == (False, False)
+                and lkey.name == rkey.name
+            )
+        ]
+
+    def _drop_duplicate_key_columns(self, lhs: Frame, rhs: Frame) -> Frame:
+        # Except for outer joins, where they are needed to fill the nulls
+        # of the left keys, key columns of `rhs` sharing their name with a
+        # column of `lhs` are dropped from the result by `_merge_results`.
+        # Drop them here already so that they are not gathered at all.
+        if self.how == "outer" or not isinstance(rhs, cudf.DataFrame):
+            return rhs
+        key_columns_with_same_name = self._key_columns_with_same_name()
+        columns = {
+            name: col
+            for name, col in rhs._data.items()
+            if not (name in lhs._data and name in key_columns_with_same_name)
+        }
+        if len(columns) == len(rhs._data):
+            return rhs
+        data = rhs._data.__class__._create_unsafe(
+            columns,
+            multiindex=rhs._data.multiindex,
+            level_names=rhs._data.level_names,
+        )
+        return rhs._from_data(data, index=rhs._index)
+
     def _sort_result(self, result: Frame) -> Frame:
         # Pandas sorts on the key columns in the
         # same order as given in 'on'. If the indices are used as
@@ -354,25 +393,19 @@ class Merge(object):
                 # need a list instead of a tuple here because
                 # _get_sorted_inds calls down to ColumnAccessor.get_by_label
                 # which handles lists and tuples differently
-                sort_order = result._get_sorted_inds(
-                    list(_coerce_to_tuple(self.on))
-                )
+                sort_order = result._get_sorted_inds(list(self._on))
             return result._gather(sort_order, keep_index=False)
         by = []
         if self.left_index and self.right_index:
             if result._index is not None:
                 by.extend(result._index._data.columns)
         if self.left_on:
-            by.extend(
-                [result._data[col] for col in _coerce_to_tuple(self.left_on)]
-            )
+            by.extend([result._data[col] for col in self._left_on])
         if self.right_on:
-            by.extend(
-                [result._data[col] for col in _coerce_to_tuple(self.right_on)]
-            )
+            by.extend([result._data[col] for col in self._right_on])
         if by:
-            to_sort = cudf.DataFrame._from_columns(by)
-            sort_order = to_sort.argsort()
+            to_sort = cudf.core.frame.Frame(data=dict(enumerate(by)))
+            sort_order = libcudf.sort.order_by(to_sort, [True] * len(by), 0)
             result = result._gather(sort_order)
         return result
 
@@ -421,45 +454,89 @@ class Merge(object):
         ):
             raise ValueError("No common columns to perform merge on")
 
+        # Without suffixes, overlapping columns are only allowed when both
+        # left_on and right_on are given or when they are the join key
         lsuffix, rsuffix = suffixes
+        if (left_on and right_on) or lsuffix or rsuffix:
+            return
         for name in same_named_columns:
-            if name == left_on == right_on:
-                continue
-            elif left_on and right_on:
-                if (name in left_on and name in right_on) and (
-                    left_on.index(name) == right_on.index(name)
-                ):
-                    continue
-            else:
-                if not (lsuffix or rsuffix):
-                    raise ValueError(
-                        "there are overlapping columns but "
-                        "lsuffix and rsuffix are not defined"
-                    )
+            if not (name == left_on == right_on):
+                raise ValueError(
+                    "there are overlapping columns but "
+                    "lsuffix and rsuffix are not defined"
+                )
 
     def _match_key_dtypes(self, lhs: Frame, rhs: Frame) -> Tuple[Frame, Frame]:
-        # Match the dtypes of the key columns from lhs and rhs
-        out_lhs = lhs.copy(deep=False)
-        out_rhs = rhs.copy(deep=False)
+        # Match the dtypes of the key columns from lhs and rhs. The
+        # inputs are only copied once a key column actually changes.
+        out_lhs, out_rhs = lhs, rhs
         for left_key, right_key in zip(*self._keys):
             lcol, rcol = left_key.get(lhs), right_key.get(rhs)
             lcol_casted, rcol_casted = _match_join_keys(
                 lcol, rcol, how=self.how
             )
             if lcol is not lcol_casted:
+                if out_lhs is lhs:
+                    out_lhs = lhs.copy(deep=False)
                 left_key.set(out_lhs, lcol_casted, validate=False)
             if rcol is not rcol_casted:
+                if out_rhs is rhs:
+                    out_rhs = rhs.copy(deep=False)
                 right_key.set(out_rhs, rcol_casted, validate=False)
         return out_lhs, out_rhs
 
+    def _filter_probe_by_key_range(
+        self, lhs: Frame, rhs: Frame
+    ) -> Tuple[Frame, Frame]:
+        # For inner and left-semi joins, rows of the (much longer) probe
+        # side whose keys fall outside the [min, max] range of the build
+        # side's keys can never match, so drop them before joining.
+        if isinstance(lhs, cudf.BaseIndex) or isinstance(rhs, cudf.BaseIndex):
+            return lhs, rhs
+        if self.how == "inner" and len(rhs) > len(lhs):
+            probe, probe_keys = rhs, self._keys.right
+            build, build_keys = lhs, self._keys.left
+        elif self.how in {"inner", "leftsemi"}:
+            probe, probe_keys = lhs, self._keys.left
+            build, build_keys = rhs, self._keys.right
+        else:
+            return lhs, rhs
+        if len(build) == 0 or (
+            len(probe) < _PROBE_FILTER_MIN_RATIO * len(build)
+        ):
+            return lhs, rhs
+
+        mask = None
+        for probe_key, build_key in zip(probe_keys, build_keys):
+            build_col = build_key.get(build)
+            # Only integer and datetime-like keys are range filtered: floats
+            # may hold NaNs, and null build keys would match null probe keys
+            if (
+                not isinstance(build_col.dtype, np.dtype)
+                or build_col.dtype.kind not in "iumM"
+                or build_col.has_nulls
+            ):
+                continue
+            probe_col = probe_key.get(probe)
+            lo, hi = minmax(build_col)
+            key_mask = (probe_col >= lo) & (probe_col <= hi)
+            mask = key_mask if mask is None else mask & key_mask
+        if mask is None:
+            return lhs, rhs
+
+        probe = probe._apply_boolean_mask(mask)
+        if probe_keys is self._keys.left:
+            return probe, rhs
+        return lhs, probe
+
     def _restore_categorical_keys(
         self, lhs: Frame, rhs: Frame
     ) -> Tuple[Frame, Frame]:
         # For inner joins, any categorical keys in `self.lhs` and `self.rhs`
         # were casted to their category type to produce `lhs` and `rhs`.
-        # Here, we cast them back.
-        out_lhs = lhs.copy(deep=False)
-        out_rhs = rhs.copy(deep=False)
+        # Here, we cast them back. The inputs are only copied if there is
+        # such a key.
+        out_lhs, out_rhs = lhs, rhs
         if self.how == "inner":
             for left_key, right_key in zip(*self._keys):
                 if isinstance(
@@ -467,6 +544,9 @@ class Merge(object):
                 ) and isinstance(
                     right_key.get(self.rhs).dtype, cudf.CategoricalDtype
                 ):
+                    if out_lhs is lhs:
+                        out_lhs = lhs.copy(deep=False)
+                        out_rhs = rhs.copy(deep=False)
                     left_key.set(
                         out_lhs,
                         left_key.get(out_lhs).astype("category"),
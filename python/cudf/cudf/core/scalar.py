@@ -1,5 +1,7 @@
 # Copyright (c) 2020-2021, NVIDIA CORPORATION.
 import decimal
+import functools
+import operator
 
 import numpy as np
 import pyarrow as pa
@@ -15,6 +17,34 @@ from cudf.utils.dtypes import (
     to_cudf_compatible_scalar,
 )
 
+_BINOPS = {
+    "__add__": operator.add,
+    "__radd__": lambda x, y: operator.add(y, x),
+    "__sub__": operator.sub,
+    "__rsub__": lambda x, y: operator.sub(y, x),
+    "__mul__": operator.mul,
+    "__rmul__": lambda x, y: operator.mul(y, x),
+    "__truediv__": operator.truediv,
+    "__rtruediv__": lambda x, y: operator.truediv(y, x),
+    "__floordiv__": operator.floordiv,
+    "__mod__": operator.mod,
+    "__divmod__": divmod,
+    "__and__": operator.and_,
+    "__or__": operator.or_,
+    "__pow__": operator.pow,
+    "__gt__": operator.gt,
+    "__lt__": operator.lt,
+    "__ge__": operator.ge,
+    "__le__": operator.le,
+    "__eq__": operator.eq,
+    "__ne__": operator.ne,
+    "__round__": round,
+}
+
+_COMPARISON_OPS = frozenset(
+    {"__eq__", "__ne__", "__lt__", "__gt__", "__le__", "__ge__"}
+)
+
 
 class Scalar(object):
     def __init__(self, value, dtype=None):
@@ -113,7 +143,10 @@ class Scalar(object):
         return not _is_null_host_scalar(self._host_value)
 
     def _device_value_to_host(self):
+        # Cache the dtype alongside the value; once the host value is
+        # current, `dtype` and the conversions below only read the cache.
         self._host_value = self._device_value._to_host_scalar()
+        self._host_dtype = self._device_value.dtype
 
     def _preprocess_host_value(self, value, dtype):
         valid = not _is_null_host_scalar(value)
@@ -300,35 +333,7 @@ class Scalar(object):
         )
 
     def _binop_result_dtype_or_error(self, other, op):
-        if op in {"__eq__", "__ne__", "__lt__", "__gt__", "__le__", "__ge__"}:
-            return np.bool_
-
-        out_dtype = get_allowed_combinations_for_operator(
-            self.dtype, other.dtype, op
-        )
-
-        # datetime handling
-        if out_dtype in {"M", "m"}:
-            if self.dtype.char in {"M", "m"} and other.dtype.char not in {
-                "M",
-                "m",
-            }:
-                return self.dtype
-            if other.dtype.char in {"M", "m"} and self.dtype.char not in {
-                "M",
-                "m",
-            }:
-                return other.dtype
-            else:
-                if (
-                    op == "__sub__"
-                    and self.dtype.char == other.dtype.char == "M"
-                ):
-                    res, _ = np.datetime_data(max(self.dtype, other.dtype))
-                    return np.dtype("m8" + f"[{res}]")
-                return np.result_type(self.dtype, other.dtype)
-
-        return np.dtype(out_dtype)
+        return _binop_result_dtype_or_error(self.dtype, other.dtype, op)
 
     def _scalar_binop(self, other, op):
         if isinstance(other, (ColumnBase, Series, BaseIndex, np.ndarray)):
@@ -336,8 +341,8 @@ class Scalar(object):
             return NotImplemented
         other = to_cudf_compatible_scalar(other)
         out_dtype = self._binop_result_dtype_or_error(other, op)
-        valid = self.is_valid and (
-            isinstance(other, np.generic) or other.is_valid
+        valid = self.is_valid() and (
+            isinstance(other, np.generic) or other.is_valid()
         )
         if not valid:
             return Scalar(None, dtype=out_dtype)
@@ -348,7 +353,7 @@ class Scalar(object):
     def _dispatch_scalar_binop(self, other, op):
         if isinstance(other, Scalar):
             other = other.value
-        return getattr(self.value, op)(other)
+        return _BINOPS[op](self.value, other)
 
     def _unaop_result_type_or_error(self, op):
         if op == "__neg__" and self.dtype == "bool":
@@ -383,6 +388,30 @@ class Scalar(object):
         return Scalar(self.value, dtype)
 
 
+@functools.lru_cache(maxsize=256)
+def _binop_result_dtype_or_error(dtype_l, dtype_r, op):
+    # The result dtype only depends on the operand dtypes and the operator,
+    # so it is memoized for the few combinations seen in practice.
+    if op in _COMPARISON_OPS:
+        return np.bool_
+
+    out_dtype = get_allowed_combinations_for_operator(dtype_l, dtype_r, op)
+
+    # datetime handling
+    if out_dtype in {"M", "m"}:
+        if dtype_l.char in {"M", "m"} and dtype_r.char not in {"M", "m"}:
+            return dtype_l
+        if dtype_r.char in {"M", "m"} and dtype_l.char not in {"M", "m"}:
+            return dtype_r
+        else:
+            if op == "__sub__" and dtype_l.char == dtype_r.char == "M":
+                res, _ = np.datetime_data(max(dtype_l, dtype_r))
+                return np.dtype("m8" + f"[{res}]")
+            return np.result_type(dtype_l, dtype_r)
+
+    return np.dtype(out_dtype)
+
+
 class _NAType(pd_NAType):
     # Pandas NAType enforces a single instance exists at a time
     # instantiating this class will yield the existing instance
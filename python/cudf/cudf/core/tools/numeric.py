@@ -7,6 +7,8 @@ import pandas as pd
 
 import cudf
 from cudf import _lib as libcudf
+from cudf._lib.reduce import minmax
+from cudf._lib.transform import bools_to_mask
 from cudf.core.column import as_column
 from cudf.utils.dtypes import (
     _is_non_decimal_numeric_dtype,
@@ -99,6 +101,18 @@ def to_numeric(arg, errors="raise", downcast=None):
     if downcast not in {None, "integer", "signed", "unsigned", "float"}:
         raise ValueError("invalid downcasting method provided")
 
+    # A numeric Series needs no parsing, which is the common case when
+    # to_numeric is called defensively. float32 is excluded since it is
+    # widened to float64 below.
+    if (
+        downcast is None
+        and isinstance(arg, cudf.Series)
+        and isinstance(arg.dtype, np.dtype)
+        and arg.dtype.kind in "biuf"
+        and arg.dtype != np.dtype("f")
+    ):
+        return cudf.Series(arg._column)
+
     if not can_convert_to_column(arg) or (
         hasattr(arg, "ndim") and arg.ndim > 1
     ):
@@ -107,7 +121,11 @@ def to_numeric(arg, errors="raise", downcast=None):
     col = as_column(arg)
     dtype = col.dtype
 
-    if is_datetime_dtype(dtype) or is_timedelta_dtype(dtype):
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        # Already numeric, which is the common case when called defensively,
+        # so skip the chain of dtype checks below
+        pass
+    elif is_datetime_dtype(dtype) or is_timedelta_dtype(dtype):
         col = col.as_numerical_column(np.dtype("int64"))
     elif is_categorical_dtype(dtype):
         cat_dtype = col.dtype.type
@@ -154,20 +172,58 @@ def to_numeric(arg, errors="raise", downcast=None):
 
         type_set = downcast_type_map[downcast]
 
-        for t in type_set:
-            downcast_dtype = np.dtype(t)
-            if downcast_dtype.itemsize <= col.dtype.itemsize:
-                if col.can_cast_safely(downcast_dtype):
-                    col = libcudf.unary.cast(col, downcast_dtype)
-                    break
+        if (
+            downcast != "float"
+            and col.dtype.kind in {"i", "u"}
+            and col.valid_count
+        ):
+            # Integer to integer downcasts only depend on the range of the
+            # values, so reduce the column once instead of once per
+            # candidate dtype
+            lo, hi = (extremum.value for extremum in minmax(col))
+            for t in type_set:
+                downcast_dtype = np.dtype(t)
+                if downcast_dtype.itemsize <= col.dtype.itemsize:
+                    if _integer_range_casts_safely(
+                        col.dtype, downcast_dtype, lo, hi
+                    ):
+                        col = libcudf.unary.cast(col, downcast_dtype)
+                        break
+        else:
+            for t in type_set:
+                downcast_dtype = np.dtype(t)
+                if downcast_dtype.itemsize <= col.dtype.itemsize:
+                    if col.can_cast_safely(downcast_dtype):
+                        col = libcudf.unary.cast(col, downcast_dtype)
+                        break
 
     if isinstance(arg, (cudf.Series, pd.Series)):
         return cudf.Series(col)
     else:
-        col = col.fillna(col.default_na_value())
+        if col.has_nulls:
+            col = col.fillna(col.default_na_value())
         return col.values
 
 
+def _integer_range_casts_safely(from_dtype, to_dtype, lo, hi):
+    """
+    Whether integers of ``from_dtype`` in the range [``lo``, ``hi``] can be
+    cast to the integer dtype ``to_dtype``, following the same rules as
+    ``NumericalColumn.can_cast_safely``.
+    """
+    to_max = np.iinfo(to_dtype).max
+    if from_dtype.kind == to_dtype.kind:
+        if from_dtype <= to_dtype:
+            return True
+        return lo >= np.iinfo(to_dtype).min and hi < to_max
+    elif to_dtype.kind == "u":
+        # signed to unsigned
+        return lo >= 0 and (np.iinfo(from_dtype).max <= to_max or hi < to_max)
+    else:
+        # unsigned to signed
+        return np.iinfo(from_dtype).max <= to_max or hi < to_max
+
+
 def _convert_str_col(col, errors, _downcast=None):
     """
     Converts a string column to numeric column
@@ -198,9 +254,16 @@ def _convert_str_col(col, errors, _downcast=None):
     if is_integer.all():
         return col.as_numerical_column(dtype=np.dtype("i8"))
 
-    col = _proc_inf_empty_strings(col)
-
+    # Most inputs are already in the format libcudf parses, in which case
+    # the passes that normalize empty and infinity strings are skipped.
+    # Otherwise only the failing strings are normalized, so that each value
+    # converts the same way regardless of the rest of the column.
     is_float = col.str().isfloat()
+    if not is_float.all():
+        col = libcudf.copying.copy_if_else(
+            col, _proc_inf_empty_strings(col), is_float
+        )
+        is_float = col.str().isfloat()
     if is_float.all():
         if _downcast in {"unsigned", "signed", "integer"}:
             warnings.warn(
@@ -215,9 +278,8 @@ def _convert_str_col(col, errors, _downcast=None):
     else:
         if errors == "coerce":
             col = libcudf.string_casting.stod(col)
-            non_numerics = is_float.unary_operator("not")
-            col[non_numerics] = None
-            return col
+            # Null and non-numeric strings are both unset in this mask
+            return col.set_mask(bools_to_mask(is_float))
         else:
             raise ValueError("Unable to convert some strings to numerics.")
 
@@ -3,24 +3,31 @@
 import datetime
 import warnings
 
+import numpy as np
 import pyarrow as pa
 from fsspec.utils import stringify_path
 from pyarrow import orc as orc
 
 import cudf
 from cudf._lib import orc as liborc
+from cudf.core.column_accessor import ColumnAccessor
 from cudf.utils import ioutils
 from cudf.utils.dtypes import is_list_like
 from cudf.utils.metadata import (  # type: ignore
     orc_column_statistics_pb2 as cs_pb2,
 )
 
+# Date and timestamp statistics are stored relative to the Unix epoch
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 def _make_empty_df(filepath_or_buffer, columns):
     orc_file = orc.ORCFile(filepath_or_buffer)
     schema = orc_file.schema
     col_names = schema.names if columns is None else columns
-    return cudf.DataFrame(
+    # Every column is empty, so the constructor's alignment and validation
+    # of the inputs can be skipped
+    data = ColumnAccessor._create_unsafe(
         {
             col_name: cudf.core.column.column_empty(
                 row_count=0,
@@ -29,6 +36,7 @@ def _make_empty_df(filepath_or_buffer, columns):
             for col_name in col_names
         }
     )
+    return cudf.DataFrame._from_data(data)
 
 
 def _parse_column_statistics(cs, column_statistics_blob):
@@ -42,17 +50,20 @@ def _parse_column_statistics(cs, column_statistics_blob):
     if cs.HasField("hasNull"):
         column_statistics["has_null"] = cs.hasNull
     if cs.HasField("intStatistics"):
-        column_statistics["minimum"] = cs.intStatistics.minimum
-        column_statistics["maximum"] = cs.intStatistics.maximum
-        column_statistics["sum"] = cs.intStatistics.sum
+        statistics = cs.intStatistics
+        column_statistics["minimum"] = statistics.minimum
+        column_statistics["maximum"] = statistics.maximum
+        column_statistics["sum"] = statistics.sum
     elif cs.HasField("doubleStatistics"):
-        column_statistics["minimum"] = cs.doubleStatistics.minimum
-        column_statistics["maximum"] = cs.doubleStatistics.maximum
-        column_statistics["sum"] = cs.doubleStatistics.sum
+        statistics = cs.doubleStatistics
+        column_statistics["minimum"] = statistics.minimum
+        column_statistics["maximum"] = statistics.maximum
+        column_statistics["sum"] = statistics.sum
     elif cs.HasField("stringStatistics"):
-        column_statistics["minimum"] = cs.stringStatistics.minimum
-        column_statistics["maximum"] = cs.stringStatistics.maximum
-        column_statistics["sum"] = cs.stringStatistics.sum
+        statistics = cs.stringStatistics
+        column_statistics["minimum"] = statistics.minimum
+        column_statistics["maximum"] = statistics.maximum
+        column_statistics["sum"] = statistics.sum
     elif cs.HasField("bucketStatistics"):
         column_statistics["true_count"] = cs.bucketStatistics.count[0]
         column_statistics["false_count"] = (
@@ -60,17 +71,17 @@ def _parse_column_statistics(cs, column_statistics_blob):
             - column_statistics["true_count"]
         )
     elif cs.HasField("decimalStatistics"):
-        column_statistics["minimum"] = cs.decimalStatistics.minimum
-        column_statistics["maximum"] = cs.decimalStatistics.maximum
-        column_statistics["sum"] = cs.decimalStatistics.sum
+        statistics = cs.decimalStatistics
+        column_statistics["minimum"] = statistics.minimum
+        column_statistics["maximum"] = statistics.maximum
+        column_statistics["sum"] = statistics.sum
     elif cs.HasField("dateStatistics"):
-        column_statistics["minimum"] = datetime.datetime.fromtimestamp(
-            datetime.timedelta(cs.dateStatistics.minimum).total_seconds(),
-            datetime.timezone.utc,
+        statistics = cs.dateStatistics
+        column_statistics["minimum"] = _EPOCH + datetime.timedelta(
+            days=statistics.minimum
         )
-        column_statistics["maximum"] = datetime.datetime.fromtimestamp(
-            datetime.timedelta(cs.dateStatistics.maximum).total_seconds(),
-            datetime.timezone.utc,
+        column_statistics["maximum"] = _EPOCH + datetime.timedelta(
+            days=statistics.maximum
         )
     elif cs.HasField("timestampStatistics"):
         # Before ORC-135, the local timezone offset was included and they were
@@ -78,14 +89,15 @@ def _parse_column_statistics(cs, column_statistics_blob):
         # adjusted to UTC before being converted to milliseconds and stored
         # in minimumUtc and maximumUtc.
         # TODO: Support minimum and maximum by reading writer's local timezone
-        if cs.timestampStatistics.HasField(
+        statistics = cs.timestampStatistics
+        if statistics.HasField(
             "minimumUtc"
-        ) and cs.timestampStatistics.HasField("maximumUtc"):
-            column_statistics["minimum"] = datetime.datetime.fromtimestamp(
-                cs.timestampStatistics.minimumUtc / 1000, datetime.timezone.utc
+        ) and statistics.HasField("maximumUtc"):
+            column_statistics["minimum"] = _EPOCH + datetime.timedelta(
+                milliseconds=statistics.minimumUtc
             )
-            column_statistics["maximum"] = datetime.datetime.fromtimestamp(
-                cs.timestampStatistics.maximumUtc / 1000, datetime.timezone.utc
+            column_statistics["maximum"] = _EPOCH + datetime.timedelta(
+                milliseconds=statistics.maximumUtc
             )
     elif cs.HasField("binaryStatistics"):
         column_statistics["sum"] = cs.binaryStatistics.sum
@@ -112,15 +124,30 @@ def read_orc_statistics(
 ):
     """{docstring}"""
 
-    files_statistics = []
-    stripes_statistics = []
+    return _read_orc_statistics(
+        _resolve_statistics_sources(filepaths_or_buffers, **kwargs), columns
+    )
+
+
+def _resolve_statistics_sources(filepaths_or_buffers, **kwargs):
+    resolved_filepaths_or_buffers = []
     for source in filepaths_or_buffers:
         filepath_or_buffer, compression = ioutils.get_filepath_or_buffer(
             path_or_data=source, compression=None, **kwargs
         )
         if compression is not None:
             ValueError("URL content-encoding decompression is not supported")
+        resolved_filepaths_or_buffers.append(filepath_or_buffer)
+    return resolved_filepaths_or_buffers
+
 
+def _read_orc_statistics(filepaths_or_buffers, columns=None):
+    # Sources must already be resolved by ioutils.get_filepath_or_buffer
+    files_statistics = []
+    stripes_statistics = []
+    if columns is not None:
+        columns = set(columns)
+    for filepath_or_buffer in filepaths_or_buffers:
         # Read in statistics and unpack
         (
             column_names,
@@ -133,13 +160,20 @@ def read_orc_statistics(
             column_name.decode("utf-8") for column_name in column_names
         ]
 
+        # Only the statistics of the requested columns are parsed
+        selected = {
+            i
+            for i, column_name in enumerate(column_names)
+            if columns is None or column_name in columns
+        }
+
         # Parse statistics
         cs = cs_pb2.ColumnStatistics()
 
         file_statistics = {
             column_names[i]: _parse_column_statistics(cs, raw_file_stats)
             for i, raw_file_stats in enumerate(raw_file_statistics)
-            if columns is None or column_names[i] in columns
+            if i in selected
         }
         if any(
             not parsed_statistics
@@ -153,7 +187,7 @@ def read_orc_statistics(
             stripe_statistics = {
                 column_names[i]: _parse_column_statistics(cs, raw_file_stats)
                 for i, raw_file_stats in enumerate(raw_stripe_statistics)
-                if columns is None or column_names[i] in columns
+                if i in selected
             }
             if any(
                 not parsed_statistics
@@ -174,6 +208,21 @@ def _filter_stripes(
     if not is_list_like(filepath_or_buffer):
         filepath_or_buffer = [filepath_or_buffer]
 
+    return _filter_resolved_stripes(
+        filters,
+        _resolve_statistics_sources(filepath_or_buffer),
+        stripes,
+        skip_rows,
+        num_rows,
+    )
+
+
+def _filter_resolved_stripes(
+    filters, filepaths_or_buffers, stripes=None, skip_rows=None, num_rows=None
+):
+    # Same as _filter_stripes, for a list of sources that have already been
+    # resolved by ioutils.get_filepath_or_buffer, as read_orc does
+
     # Prepare filters
     filters = ioutils._prepare_filters(filters)
 
@@ -183,10 +232,34 @@ def _filter_stripes(
     ]
 
     # Read and parse file-level and stripe-level statistics
-    file_statistics, stripes_statistics = read_orc_statistics(
-        filepath_or_buffer, columns_in_predicate
+    file_statistics, stripes_statistics = _read_orc_statistics(
+        filepaths_or_buffers, columns_in_predicate
     )
 
+    # Only the stripes overlapping the rows in
+    # [skip_rows, skip_rows + num_rows) need to be considered. Every column
+    # of a stripe holds the same number of values, so any one of the
+    # filtered columns gives the stripe's row count.
+    first_col = columns_in_predicate[0]
+    stripe_row_counts = np.array(
+        [
+            stripe_statistics[first_col]["number_of_values"]
+            for stripe_statistics in stripes_statistics
+        ],
+        dtype="int64",
+    )
+    stripe_row_ends = np.cumsum(stripe_row_counts)
+    stripe_row_starts = stripe_row_ends - stripe_row_counts
+    if skip_rows is None:
+        skip_rows = 0
+    first_stripe = np.searchsorted(stripe_row_ends, skip_rows, side="right")
+    if num_rows is None:
+        last_stripe = len(stripes_statistics)
+    else:
+        last_stripe = np.searchsorted(
+            stripe_row_starts, skip_rows + num_rows, side="left"
+        )
+
     file_stripe_map = []
     for file_stat in file_statistics:
         # Filter using file-level statistics
@@ -195,25 +268,10 @@ def _filter_stripes(
 
         # Filter using stripe-level statistics
         selected_stripes = []
-        num_rows_scanned = 0
-        for i, stripe_statistics in enumerate(stripes_statistics):
-            num_rows_before_stripe = num_rows_scanned
-            num_rows_scanned += next(iter(stripe_statistics.values()))[
-                "number_of_values"
-            ]
+        for i in range(first_stripe, last_stripe):
             if stripes is not None and i not in stripes:
                 continue
-            if skip_rows is not None and num_rows_scanned <= skip_rows:
-                continue
-            else:
-                skip_rows = 0
-            if (
-                skip_rows is not None
-                and num_rows is not None
-                and num_rows_before_stripe >= skip_rows + num_rows
-            ):
-                continue
-            if ioutils._apply_filters(filters, stripe_statistics):
+            if ioutils._apply_filters(filters, stripes_statistics[i]):
                 selected_stripes.append(i)
 
         file_stripe_map.append(selected_stripes)
@@ -279,7 +337,7 @@ def read_orc(
             filepaths_or_buffers.append(tmp_source)
 
     if filters is not None:
-        selected_stripes = _filter_stripes(
+        selected_stripes = _filter_resolved_stripes(
             filters, filepaths_or_buffers, stripes, skiprows, num_rows
         )
 
@@ -303,13 +361,6 @@ def read_orc(
             )
         )
     else:
-
-        def read_orc_stripe(orc_file, stripe, columns):
-            pa_table = orc_file.read_stripe(stripe, columns)
-            if isinstance(pa_table, pa.RecordBatch):
-                pa_table = pa.Table.from_batches([pa_table])
-            return pa_table
-
         warnings.warn("Using CPU via PyArrow to read ORC dataset.")
         if len(filepath_or_buffer) > 1:
             raise NotImplementedError(
@@ -319,12 +370,15 @@ def read_orc(
 
         orc_file = orc.ORCFile(filepath_or_buffer[0])
         if stripes is not None and len(stripes) > 0:
-            for stripe_source_file in stripes:
-                pa_tables = [
-                    read_orc_stripe(orc_file, i, columns)
-                    for i in stripe_source_file
-                ]
-                pa_table = pa.concat_tables(pa_tables)
+            if len(stripes) != 1:
+                raise ValueError(
+                    "Using CPU via PyArrow only supports a single list of "
+                    "stripes, one for the single input source"
+                )
+            (stripe_source_file,) = stripes
+            pa_table = pa.Table.from_batches(
+                [orc_file.read_stripe(i, columns) for i in stripe_source_file]
+            )
         else:
             pa_table = orc_file.read(columns=columns)
         df = cudf.DataFrame.from_arrow(pa_table)
@@ -9,921 +9,1007 @@ import cudf
 from cudf.api import types as types
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), False),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, True),
-        (pd.CategoricalDtype, True),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), True),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, True),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, False),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), True),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), False),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), True),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        # TODO: Currently creating an empty Series of list type ignores the
-        # provided type and instead makes a float64 Series.
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        # TODO: Currently creating an empty Series of struct type fails because
-        # it uses a numpy utility that doesn't understand StructDtype.
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+# Objects passed to every check in test_dtype_check, built once and shared
+# by all of them. Each check pairs them, in order, with its own tuple of
+# expected results.
+_OBJS = (
+    # Base Python objects.
+    bool(),
+    int(),
+    float(),
+    complex(),
+    str(),
+    "",
+    r"",
+    object(),
+    # Base Python types.
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    object,
+    # NumPy types.
+    np.bool_,
+    np.int_,
+    np.float64,
+    np.complex128,
+    np.str_,
+    np.unicode_,
+    np.datetime64,
+    np.timedelta64,
+    # NumPy scalars.
+    np.bool_(),
+    np.int_(),
+    np.float64(),
+    np.complex128(),
+    np.str_(),
+    np.unicode_(),
+    np.datetime64(),
+    np.timedelta64(),
+    # NumPy dtype objects.
+    np.dtype("bool"),
+    np.dtype("int"),
+    np.dtype("float"),
+    np.dtype("complex"),
+    np.dtype("str"),
+    np.dtype("unicode"),
+    np.dtype("datetime64"),
+    np.dtype("timedelta64"),
+    np.dtype("object"),
+    # NumPy arrays.
+    np.array([], dtype=np.bool_),
+    np.array([], dtype=np.int_),
+    np.array([], dtype=np.float64),
+    np.array([], dtype=np.complex128),
+    np.array([], dtype=np.str_),
+    np.array([], dtype=np.unicode_),
+    np.array([], dtype=np.datetime64),
+    np.array([], dtype=np.timedelta64),
+    np.array([], dtype=object),
+    # Pandas dtypes.
+    pd.core.dtypes.dtypes.CategoricalDtypeType,
+    pd.CategoricalDtype,
+    # Pandas objects.
+    pd.Series(dtype="bool"),
+    pd.Series(dtype="int"),
+    pd.Series(dtype="float"),
+    pd.Series(dtype="complex"),
+    pd.Series(dtype="str"),
+    pd.Series(dtype="unicode"),
+    pd.Series(dtype="datetime64[s]"),
+    pd.Series(dtype="timedelta64[s]"),
+    pd.Series(dtype="category"),
+    pd.Series(dtype="object"),
+    # cuDF dtypes.
+    cudf.CategoricalDtype,
+    cudf.ListDtype,
+    cudf.StructDtype,
+    cudf.Decimal64Dtype,
+    cudf.IntervalDtype,
+    # cuDF dtype instances.
+    cudf.CategoricalDtype("a"),
+    cudf.ListDtype(int),
+    cudf.StructDtype({"a": int}),
+    cudf.Decimal64Dtype(5, 2),
+    cudf.IntervalDtype(int),
+    # cuDF objects
+    cudf.Series(dtype="bool"),
+    cudf.Series(dtype="int"),
+    cudf.Series(dtype="float"),
+    cudf.Series(dtype="str"),
+    cudf.Series(dtype="datetime64[s]"),
+    cudf.Series(dtype="timedelta64[s]"),
+    cudf.Series(dtype="category"),
+    cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)),
+    # TODO: Currently creating an empty Series of list type ignores the
+    # provided type and instead makes a float64 Series.
+    cudf.Series([[1, 2], [3, 4, 5]]),
+    # TODO: Currently creating an empty Series of struct type fails because
+    # it uses a numpy utility that doesn't understand StructDtype.
+    cudf.Series([{"a": 1, "b": 2}, {"c": 3}]),
+    cudf.Series(dtype=cudf.IntervalDtype(int)),
 )
-def test_is_categorical_dtype(obj, expect):
-    assert types.is_categorical_dtype(obj) == expect
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, True),
-        (int, True),
-        (float, True),
-        (complex, True),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, True),
-        (np.int_, True),
-        (np.float64, True),
-        (np.complex128, True),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), True),
-        (np.int_(), True),
-        (np.float64(), True),
-        (np.complex128(), True),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), True),
-        (np.dtype("int"), True),
-        (np.dtype("float"), True),
-        (np.dtype("complex"), True),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), True),
-        (np.array([], dtype=np.int_), True),
-        (np.array([], dtype=np.float64), True),
-        (np.array([], dtype=np.complex128), True),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), True),
-        (pd.Series(dtype="int"), True),
-        (pd.Series(dtype="float"), True),
-        (pd.Series(dtype="complex"), True),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, True),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), True),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), True),
-        (cudf.Series(dtype="int"), True),
-        (cudf.Series(dtype="float"), True),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), True),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+def _cases(expect):
+    # An expected result of None means the object is not checked
+    assert len(expect) == len(_OBJS)
+    return [(obj, e) for obj, e in zip(_OBJS, expect) if e is not None]
+
+
+_IS_CATEGORICAL_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    False,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    True,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    True,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    True,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    True,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    True,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    True,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_numeric_dtype(obj, expect):
-    assert types.is_numeric_dtype(obj) == expect
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, True),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, True),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), True),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), True),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), True),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), True),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, False),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), False),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), True),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+_IS_NUMERIC_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    True,  # bool
+    True,  # int
+    True,  # float
+    True,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    True,  # np.bool_
+    True,  # np.int_
+    True,  # np.float64
+    True,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    True,  # np.bool_()
+    True,  # np.int_()
+    True,  # np.float64()
+    True,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    True,  # np.dtype("bool")
+    True,  # np.dtype("int")
+    True,  # np.dtype("float")
+    True,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    True,  # np.array([], dtype=np.bool_)
+    True,  # np.array([], dtype=np.int_)
+    True,  # np.array([], dtype=np.float64)
+    True,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    True,  # pd.Series(dtype="bool")
+    True,  # pd.Series(dtype="int")
+    True,  # pd.Series(dtype="float")
+    True,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    True,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    True,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    True,  # cudf.Series(dtype="bool")
+    True,  # cudf.Series(dtype="int")
+    True,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    True,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_integer_dtype(obj, expect):
-    assert types.is_integer_dtype(obj) == expect
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), True),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), True),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, False),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), False),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+_IS_INTEGER_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    True,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    True,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    True,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    True,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    True,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    True,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    True,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
+)
+
+
+_IS_INTEGER_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    True,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    True,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_integer(obj, expect):
-    assert types.is_integer(obj) == expect
 
 
 # TODO: Temporarily ignoring all cases of "object" until we decide what to do.
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, True),
-        # (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, True),
-        (np.unicode_, True),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), False),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), True),
-        (np.unicode_(), True),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), True),
-        (np.dtype("unicode"), True),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        # (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), True),
-        (np.array([], dtype=np.unicode_), True),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        # (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), True),
-        (pd.Series(dtype="unicode"), True),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        # (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, False),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), False),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), True),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+_IS_STRING_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    True,  # str
+    None,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    True,  # np.str_
+    True,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    False,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    True,  # np.str_()
+    True,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    True,  # np.dtype("str")
+    True,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    None,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    True,  # np.array([], dtype=np.str_)
+    True,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    None,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    True,  # pd.Series(dtype="str")
+    True,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    None,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    True,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_string_dtype(obj, expect):
-    assert types.is_string_dtype(obj) == expect
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, True),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), False),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), True),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), True),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), True),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), True),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, False),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), False),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), True),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+_IS_DATETIME_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    True,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    False,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    True,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    True,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    True,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    True,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    True,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_datetime_dtype(obj, expect):
-    assert types.is_datetime_dtype(obj) == expect
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), False),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, True),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, False),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), True),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), False),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        (cudf.Series([[1, 2], [3, 4, 5]]), True),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+_IS_LIST_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    False,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    True,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    True,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    True,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_list_dtype(obj, expect):
-    assert types.is_list_dtype(obj) == expect
 
 
-@pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), False),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, True),
-        (cudf.Decimal64Dtype, False),
-        # (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), True),
-        (cudf.Decimal64Dtype(5, 2), False),
-        # (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), False),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), True),
-        # (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+# TODO: All inputs of interval types are currently disabled due to
+# inconsistent behavior of is_struct_dtype for interval types that will be
+# fixed as part of the array refactor.
+_IS_STRUCT_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    False,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    True,  # cudf.StructDtype
+    False,  # cudf.Decimal64Dtype
+    None,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    True,  # cudf.StructDtype({"a": int})
+    False,  # cudf.Decimal64Dtype(5, 2)
+    None,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    False,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    True,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    None,  # cudf.Series(dtype=cudf.IntervalDtype(int))
+)
+
+
+_IS_DECIMAL_DTYPE_EXPECT = (
+    # Base Python objects.
+    False,  # bool()
+    False,  # int()
+    False,  # float()
+    False,  # complex()
+    False,  # str()
+    False,  # ""
+    False,  # r""
+    False,  # object()
+    # Base Python types.
+    False,  # bool
+    False,  # int
+    False,  # float
+    False,  # complex
+    False,  # str
+    False,  # object
+    # NumPy types.
+    False,  # np.bool_
+    False,  # np.int_
+    False,  # np.float64
+    False,  # np.complex128
+    False,  # np.str_
+    False,  # np.unicode_
+    False,  # np.datetime64
+    False,  # np.timedelta64
+    # NumPy scalars.
+    False,  # np.bool_()
+    False,  # np.int_()
+    False,  # np.float64()
+    False,  # np.complex128()
+    False,  # np.str_()
+    False,  # np.unicode_()
+    False,  # np.datetime64()
+    False,  # np.timedelta64()
+    # NumPy dtype objects.
+    False,  # np.dtype("bool")
+    False,  # np.dtype("int")
+    False,  # np.dtype("float")
+    False,  # np.dtype("complex")
+    False,  # np.dtype("str")
+    False,  # np.dtype("unicode")
+    False,  # np.dtype("datetime64")
+    False,  # np.dtype("timedelta64")
+    False,  # np.dtype("object")
+    # NumPy arrays.
+    False,  # np.array([], dtype=np.bool_)
+    False,  # np.array([], dtype=np.int_)
+    False,  # np.array([], dtype=np.float64)
+    False,  # np.array([], dtype=np.complex128)
+    False,  # np.array([], dtype=np.str_)
+    False,  # np.array([], dtype=np.unicode_)
+    False,  # np.array([], dtype=np.datetime64)
+    False,  # np.array([], dtype=np.timedelta64)
+    False,  # np.array([], dtype=object)
+    # Pandas dtypes.
+    False,  # pd.core.dtypes.dtypes.CategoricalDtypeType
+    False,  # pd.CategoricalDtype
+    # Pandas objects.
+    False,  # pd.Series(dtype="bool")
+    False,  # pd.Series(dtype="int")
+    False,  # pd.Series(dtype="float")
+    False,  # pd.Series(dtype="complex")
+    False,  # pd.Series(dtype="str")
+    False,  # pd.Series(dtype="unicode")
+    False,  # pd.Series(dtype="datetime64[s]")
+    False,  # pd.Series(dtype="timedelta64[s]")
+    False,  # pd.Series(dtype="category")
+    False,  # pd.Series(dtype="object")
+    # cuDF dtypes.
+    False,  # cudf.CategoricalDtype
+    False,  # cudf.ListDtype
+    False,  # cudf.StructDtype
+    True,  # cudf.Decimal64Dtype
+    False,  # cudf.IntervalDtype
+    # cuDF dtype instances.
+    False,  # cudf.CategoricalDtype("a")
+    False,  # cudf.ListDtype(int)
+    False,  # cudf.StructDtype({"a": int})
+    True,  # cudf.Decimal64Dtype(5, 2)
+    False,  # cudf.IntervalDtype(int)
+    # cuDF objects
+    False,  # cudf.Series(dtype="bool")
+    False,  # cudf.Series(dtype="int")
+    False,  # cudf.Series(dtype="float")
+    False,  # cudf.Series(dtype="str")
+    False,  # cudf.Series(dtype="datetime64[s]")
+    False,  # cudf.Series(dtype="timedelta64[s]")
+    False,  # cudf.Series(dtype="category")
+    True,  # cudf.Series(dtype=cudf.Decimal64Dtype(5, 2))
+    False,  # cudf.Series([[1, 2], [3, 4, 5]])
+    False,  # cudf.Series([{"a": 1, "b": 2}, {"c": 3}])
+    False,  # cudf.Series(dtype=cudf.IntervalDtype(int))
 )
-def test_is_struct_dtype(obj, expect):
-    # TODO: All inputs of interval types are currently disabled due to
-    # inconsistent behavior of is_struct_dtype for interval types that will be
-    # fixed as part of the array refactor.
-    assert types.is_struct_dtype(obj) == expect
+
+
+# Expected results of each check in cudf.api.types, keyed by its name
+_EXPECTED = {
+    "is_categorical_dtype": _IS_CATEGORICAL_DTYPE_EXPECT,
+    "is_numeric_dtype": _IS_NUMERIC_DTYPE_EXPECT,
+    "is_integer_dtype": _IS_INTEGER_DTYPE_EXPECT,
+    "is_integer": _IS_INTEGER_EXPECT,
+    "is_string_dtype": _IS_STRING_DTYPE_EXPECT,
+    "is_datetime_dtype": _IS_DATETIME_DTYPE_EXPECT,
+    "is_list_dtype": _IS_LIST_DTYPE_EXPECT,
+    "is_struct_dtype": _IS_STRUCT_DTYPE_EXPECT,
+    "is_decimal_dtype": _IS_DECIMAL_DTYPE_EXPECT,
+}
 
 
 @pytest.mark.parametrize(
-    "obj, expect",
-    (
-        # Base Python objects.
-        (bool(), False),
-        (int(), False),
-        (float(), False),
-        (complex(), False),
-        (str(), False),
-        ("", False),
-        (r"", False),
-        (object(), False),
-        # Base Python types.
-        (bool, False),
-        (int, False),
-        (float, False),
-        (complex, False),
-        (str, False),
-        (object, False),
-        # NumPy types.
-        (np.bool_, False),
-        (np.int_, False),
-        (np.float64, False),
-        (np.complex128, False),
-        (np.str_, False),
-        (np.unicode_, False),
-        (np.datetime64, False),
-        (np.timedelta64, False),
-        # NumPy scalars.
-        (np.bool_(), False),
-        (np.int_(), False),
-        (np.float64(), False),
-        (np.complex128(), False),
-        (np.str_(), False),
-        (np.unicode_(), False),
-        (np.datetime64(), False),
-        (np.timedelta64(), False),
-        # NumPy dtype objects.
-        (np.dtype("bool"), False),
-        (np.dtype("int"), False),
-        (np.dtype("float"), False),
-        (np.dtype("complex"), False),
-        (np.dtype("str"), False),
-        (np.dtype("unicode"), False),
-        (np.dtype("datetime64"), False),
-        (np.dtype("timedelta64"), False),
-        (np.dtype("object"), False),
-        # NumPy arrays.
-        (np.array([], dtype=np.bool_), False),
-        (np.array([], dtype=np.int_), False),
-        (np.array([], dtype=np.float64), False),
-        (np.array([], dtype=np.complex128), False),
-        (np.array([], dtype=np.str_), False),
-        (np.array([], dtype=np.unicode_), False),
-        (np.array([], dtype=np.datetime64), False),
-        (np.array([], dtype=np.timedelta64), False),
-        (np.array([], dtype=object), False),
-        # Pandas dtypes.
-        (pd.core.dtypes.dtypes.CategoricalDtypeType, False),
-        (pd.CategoricalDtype, False),
-        # Pandas objects.
-        (pd.Series(dtype="bool"), False),
-        (pd.Series(dtype="int"), False),
-        (pd.Series(dtype="float"), False),
-        (pd.Series(dtype="complex"), False),
-        (pd.Series(dtype="str"), False),
-        (pd.Series(dtype="unicode"), False),
-        (pd.Series(dtype="datetime64[s]"), False),
-        (pd.Series(dtype="timedelta64[s]"), False),
-        (pd.Series(dtype="category"), False),
-        (pd.Series(dtype="object"), False),
-        # cuDF dtypes.
-        (cudf.CategoricalDtype, False),
-        (cudf.ListDtype, False),
-        (cudf.StructDtype, False),
-        (cudf.Decimal64Dtype, True),
-        (cudf.IntervalDtype, False),
-        # cuDF dtype instances.
-        (cudf.CategoricalDtype("a"), False),
-        (cudf.ListDtype(int), False),
-        (cudf.StructDtype({"a": int}), False),
-        (cudf.Decimal64Dtype(5, 2), True),
-        (cudf.IntervalDtype(int), False),
-        # cuDF objects
-        (cudf.Series(dtype="bool"), False),
-        (cudf.Series(dtype="int"), False),
-        (cudf.Series(dtype="float"), False),
-        (cudf.Series(dtype="str"), False),
-        (cudf.Series(dtype="datetime64[s]"), False),
-        (cudf.Series(dtype="timedelta64[s]"), False),
-        (cudf.Series(dtype="category"), False),
-        (cudf.Series(dtype=cudf.Decimal64Dtype(5, 2)), True),
-        (cudf.Series([[1, 2], [3, 4, 5]]), False),
-        (cudf.Series([{"a": 1, "b": 2}, {"c": 3}]), False),
-        (cudf.Series(dtype=cudf.IntervalDtype(int)), False),
-    ),
+    "name, obj, expect",
+    [
+        (name, obj, expect)
+        for name, expected in _EXPECTED.items()
+        for obj, expect in _cases(expected)
+    ],
 )
-def test_is_decimal_dtype(obj, expect):
-    assert types.is_decimal_dtype(obj) == expect
+def test_dtype_check(name, obj, expect):
+    assert getattr(types, name)(obj) == expect
 
 
 @pytest.mark.parametrize(
@@ -1086,5 +1172,45 @@ def test_pandas_agreement_scalar(obj):
     assert types.is_scalar(obj) == ptypes.is_scalar(obj)
 
 
+@pytest.mark.parametrize(
+    "func",
+    (
+        types.is_categorical_dtype,
+        types.is_numeric_dtype,
+        types.is_integer_dtype,
+        types.is_string_dtype,
+        types.is_datetime_dtype,
+        types.is_timedelta_dtype,
+        types.is_list_dtype,
+        types.is_struct_dtype,
+        types.is_decimal_dtype,
+        types.is_interval_dtype,
+        types.is_bool_dtype,
+        types.is_float_dtype,
+        types.is_signed_integer_dtype,
+        types.is_unsigned_integer_dtype,
+    ),
+)
+@pytest.mark.parametrize(
+    "obj",
+    (
+        "category",
+        "int64",
+        np.dtype("int64"),
+        np.dtype("datetime64[ns]"),
+        np.float64,
+        cudf.CategoricalDtype,
+        cudf.ListDtype,
+        cudf.Decimal64Dtype,
+    ),
+)
+def test_dtype_checks_cached(func, obj):
+    expect = func.__wrapped__(obj)
+    func.cache_clear()
+    assert func(obj) == expect
+    assert func(obj) == expect
+    assert func.cache_info().hits == 1
+
+
 # TODO: Add test of interval.
 # TODO: Add test of Scalar.
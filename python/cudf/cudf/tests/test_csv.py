@@ -1933,6 +1933,29 @@ def test_csv_reader_category_error():
         cudf.read_csv(StringIO(csv_buf), dtype="category")
 
 
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        cudf.CategoricalDtype(),
+        cudf.CategoricalDtype(["a", "b", "c"]),
+        {"b": cudf.CategoricalDtype(["a", "b", "c"])},
+    ],
+)
+def test_csv_reader_cudf_category_dtype_error(dtype):
+    # cudf.CategoricalDtype is unhashable, so it must bypass the dtype
+    # string cache and still raise the intended error
+    df = cudf.DataFrame({"a": [1, 2, 3], "b": ["a", "b", "c"]})
+    csv_buf = df.to_csv()
+
+    with pytest.raises(
+        NotImplementedError,
+        match=re.escape(
+            "CategoricalDtype as dtype is not yet " "supported in CSV reader"
+        ),
+    ):
+        cudf.read_csv(StringIO(csv_buf), dtype=dtype)
+
+
 def test_csv_writer_datetime_sep():
     df = cudf.DataFrame(
         {"a": cudf.Series([22343, 2323423, 234324234], dtype="datetime64[ns]")}
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import cudf
 from cudf.core.cut import cut
 from cudf.testing._utils import assert_eq
 
@@ -300,3 +301,25 @@ def test_cut_series(x, bins, right, include_lowest, ordered, precision):
     )
 
     assert_eq(pcat, gcat)
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        pd.Series([2, 4, 6, 8, 10]),
+        pd.Series([1.5, 7.25, 5.0, 4.0, 0.5]),
+        pd.Series([1.5, np.nan, 5.0, 4.0, 0.5]),
+    ],
+)
+@pytest.mark.parametrize("bins", [1, 2, 3])
+@pytest.mark.parametrize("include_lowest", [True, False])
+def test_cut_cudf_series(x, bins, include_lowest):
+    pcat = pd.cut(x=x, bins=bins, include_lowest=include_lowest)
+    # Keep NaNs as NaN rather than null so that they reach the bin edges
+    gcat = cut(
+        x=cudf.from_pandas(x, nan_as_null=False),
+        bins=bins,
+        include_lowest=include_lowest,
+    )
+
+    assert_eq(pcat, gcat)
@@ -2112,3 +2112,15 @@ def test_string_join_values_nulls():
     got = got.sort_values(by=["a", "b", "c"]).reset_index(drop=True)
 
     assert_join_results_equal(expect, got, how="left")
+
+
+@pytest.mark.parametrize("probe_on_left", [True, False])
+def test_inner_join_probe_outside_build_key_range(probe_on_left):
+    probe = pd.DataFrame({"key": np.arange(-50, 150), "x": 1})
+    build = pd.DataFrame({"key": [3, 7, 7, 12], "y": [0.5, 1.5, 2.5, 3.5]})
+    lhs, rhs = (probe, build) if probe_on_left else (build, probe)
+
+    expect = lhs.merge(rhs, on="key", how="inner")
+    got = cudf.from_pandas(lhs).merge(cudf.from_pandas(rhs), on="key")
+
+    assert_join_results_equal(expect, got, how="inner")
@@ -180,6 +180,20 @@ def test_to_numeric_basic_1d(data):
     assert_eq(expected, got)
 
 
+@pytest.mark.parametrize("dtype", NUMERIC_TYPES + ["bool"])
+def test_to_numeric_numeric_series(dtype):
+    ps = pd.Series([1, 0, 1], dtype=dtype)
+    gs = cudf.from_pandas(ps)
+
+    expected = pd.to_numeric(ps)
+    got = cudf.to_numeric(gs)
+
+    # cudf widens float32 to float64
+    if dtype == "float32":
+        expected = expected.astype("float64")
+    assert_eq(expected, got)
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -366,6 +380,18 @@ def test_to_numeric_downcast_string_large_float(data, downcast):
         assert_eq(expected, got)
 
 
+@pytest.mark.parametrize(
+    "data", [["NaN", "inf"], ["NaN", "1"], ["NaN", "1.5"], ["NaN", ""]],
+)
+def test_to_numeric_nan_string_with_neighbours(data):
+    # "NaN" must convert the same way whether or not other values in the
+    # column need normalizing
+    expected = pd.to_numeric(data)
+    got = cudf.to_numeric(data)
+
+    assert_eq(expected, got)
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -244,6 +244,31 @@ def test_orc_read_filtered(datadir, engine, predicate, expected_len):
     assert len(df_filtered) == expected_len
 
 
+@pytest.mark.parametrize(
+    "skip_rows,num_rows,expected",
+    [
+        (None, None, [[0, 1, 2]]),
+        (4999, 1, [[0]]),
+        (5000, 1, [[1]]),
+        (6000, 100, [[1]]),
+        (9000, 2000, [[1, 2]]),
+    ],
+)
+def test_orc_filter_stripes_row_range(datadir, skip_rows, num_rows, expected):
+    path = datadir / "TestOrcFile.testStripeLevelStats.orc"
+    try:
+        got = cudf.io.orc._filter_stripes(
+            [[("int1", ">=", 0)]],
+            path,
+            skip_rows=skip_rows,
+            num_rows=num_rows,
+        )
+    except pa.ArrowIOError as e:
+        pytest.skip(".orc file is not found: %s" % e)
+
+    assert got == expected
+
+
 @pytest.mark.parametrize("engine", ["cudf", "pyarrow"])
 def test_orc_read_stripes(datadir, engine):
     path = datadir / "TestOrcFile.testDate1900.orc"
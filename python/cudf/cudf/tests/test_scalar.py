@@ -205,6 +205,26 @@ def test_null_scalar(dtype):
     assert s.is_valid() is False
 
 
+@pytest.mark.parametrize("null_lhs", [True, False])
+def test_null_scalar_binop(null_lhs):
+    null = cudf.Scalar(None, dtype="int32")
+    valid = cudf.Scalar(2, dtype="float64")
+    lhs, rhs = (null, valid) if null_lhs else (valid, null)
+
+    result = lhs + rhs
+    assert result.dtype == np.dtype("float64")
+    assert result.is_valid() is False
+
+
+def test_device_scalar_conversions_after_host_copy():
+    s = cudf.Scalar(cudf.Scalar(3, dtype="int16").device_value)
+
+    assert int(s) == 3
+    assert s.dtype == np.dtype("int16")
+    assert float(s) == 3.0
+    assert [0, 1, 2, 3, 4][s] == 3
+
+
 @pytest.mark.parametrize(
     "value",
     [
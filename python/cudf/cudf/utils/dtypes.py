@@ -473,16 +473,7 @@ def get_allowed_combinations_for_operator(dtype_l, dtype_r, op):
         f"{op} not supported between {dtype_l} and {dtype_r} scalars"
     )
 
-    to_numpy_ops = {
-        "__add__": _ADD_TYPES,
-        "__sub__": _SUB_TYPES,
-        "__mul__": _MUL_TYPES,
-        "__floordiv__": _FLOORDIV_TYPES,
-        "__truediv__": _TRUEDIV_TYPES,
-        "__mod__": _MOD_TYPES,
-        "__pow__": _POW_TYPES,
-    }
-    allowed = to_numpy_ops.get(op, op)
+    allowed = _OPERATOR_TYPES.get(op, op)
 
     # special rules for string
     if dtype_l == "object" or dtype_r == "object":
@@ -717,3 +708,12 @@ _POW_TYPES = [
     "fff",
     "ddd",
 ]
+_OPERATOR_TYPES = {
+    "__add__": _ADD_TYPES,
+    "__sub__": _SUB_TYPES,
+    "__mul__": _MUL_TYPES,
+    "__floordiv__": _FLOORDIV_TYPES,
+    "__truediv__": _TRUEDIV_TYPES,
+    "__mod__": _MOD_TYPES,
+    "__pow__": _POW_TYPES,
+}
@@ -1287,10 +1287,6 @@ def _apply_filter_not_eq(val, col_stats):
 
 
 def _apply_predicate(op, val, col_stats):
-    # Sanitize operator
-    if op not in {"=", "==", "!=", "<", "<=", ">", ">=", "in", "not in"}:
-        raise ValueError(f"'{op}' is not a valid operator in predicates.")
-
     col_min = col_stats.get("minimum", None)
     col_max = col_stats.get("maximum", None)
     col_sum = col_stats.get("sum", None)
@@ -1376,6 +1372,16 @@ def _prepare_filters(filters):
     if isinstance(filters[0][0], str):
         filters = [filters]
 
+    # Sanitize operators once, rather than each time the filters are applied
+    # to the statistics of a file or stripe
+    valid_ops = {"=", "==", "!=", "<", "<=", ">", ">=", "in", "not in"}
+    for conjunction in filters:
+        for _, op, _ in conjunction:
+            if op not in valid_ops:
+                raise ValueError(
+                    f"'{op}' is not a valid operator in predicates."
+                )
+
     return filters
 
 